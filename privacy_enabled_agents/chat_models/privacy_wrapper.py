@@ -1,10 +1,10 @@
 import logging
 from collections.abc import Callable, Sequence
 from hashlib import md5
-from json import dumps, loads
 from typing import Any, TypedDict, cast, override
 from uuid import UUID, uuid4
 
+import orjson
 from langchain_core.callbacks import CallbackManagerForLLMRun
 from langchain_core.language_models.chat_models import BaseChatModel
 from langchain_core.messages import AIMessage, BaseMessage, SystemMessage, ToolCall
@@ -23,6 +23,11 @@ from privacy_enabled_agents.storage import BaseConversationStorage
 logger = logging.getLogger(__name__)
 
 
+def _dumps(value: Any) -> str:
+    """Serialize tool call arguments to JSON, keeping non-ASCII characters as is so the detector sees e.g. umlauts in names"""
+    return orjson.dumps(value).decode()
+
+
 # Local class to define the input structure for the replace function
 class ReplaceInput(TypedDict):
     """Input for the replace function."""
@@ -292,7 +297,7 @@ class PrivacyEnabledChatModel(BaseChatModel):
                 if tool_call_id is None:
                     raise ValueError(f"Tool call ID is missing for tool call {tool_call}")
                 # Append the tool call ID and arguments dumped as a json string
-                tool_call_args = dumps(tool_call.get("args", {}))
+                tool_call_args = _dumps(tool_call.get("args", {}))
                 transformed_texts[tool_call_id] = tool_call_args
 
         # Invoke the detector to analyze the transformed texts
@@ -352,13 +357,13 @@ class PrivacyEnabledChatModel(BaseChatModel):
                     if matching_tool_call_output := detector_outputs_by_uuid.get(tool_call_id):
                         replaced_tool_call: ToolCall = tool_call.copy()
                         # Replace sensitive information in the tool call arguments
-                        tool_call_args: str = dumps(tool_call.get("args", {}))
+                        tool_call_args: str = _dumps(tool_call.get("args", {}))
                         replaced_args = self.replacer.replace(
                             text=tool_call_args,
                             entities=matching_tool_call_output,
                             thread_id=thread_id,
                         )
-                        replaced_tool_call["args"] = loads(replaced_args)
+                        replaced_tool_call["args"] = orjson.loads(replaced_args)
                         replaced_tool_calls.append(replaced_tool_call)
                     else:
                         replaced_tool_calls.append(tool_call)
@@ -384,7 +389,7 @@ class PrivacyEnabledChatModel(BaseChatModel):
         restored_message: BaseMessage = message.model_copy()
         # Restore sensitive information in the message content
         if not isinstance(message.content, str):
-            message.content = dumps(message.content)
+            message.content = _dumps(message.content)
 
         restored_message.content = self.replacer.restore(text=message.content, thread_id=thread_id)
 
@@ -394,9 +399,9 @@ class PrivacyEnabledChatModel(BaseChatModel):
             for tool_call in message.tool_calls:
                 # Restore the tool call arguments
                 restored_tool_call: ToolCall = tool_call.copy()
-                tool_call_args: str = dumps(tool_call.get("args", {}))
+                tool_call_args: str = _dumps(tool_call.get("args", {}))
                 restored_args = self.replacer.restore(text=tool_call_args, thread_id=thread_id)
-                restored_tool_call["args"] = loads(restored_args)
+                restored_tool_call["args"] = orjson.loads(restored_args)
                 restored_tool_calls.append(restored_tool_call)
 
             assert isinstance(restored_message, AIMessage), "Restored message must be an AIMessage if message is an AIMessage"
@@ -20,13 +20,15 @@ class GermanLicensePlate(str):
         return cls(value)
 
     @classmethod
-    def random(cls) -> Self:
-        handle_length: int = random.randint(1, 3)
-        handle = "".join(random.choices(string.ascii_uppercase, k=handle_length))
+    def random(cls, rng: random.Random | None = None) -> Self:
+        # The random module exposes the methods of its global generator, so it can stand in for an instance
+        generator = rng or random
+        handle_length: int = generator.randint(1, 3)
+        handle = "".join(generator.choices(string.ascii_uppercase, k=handle_length))
 
-        letters_length: int = random.randint(1, 2)
-        letters = "".join(random.choices(string.ascii_uppercase, k=letters_length))
+        letters_length: int = generator.randint(1, 2)
+        letters = "".join(generator.choices(string.ascii_uppercase, k=letters_length))
 
-        numbers = random.randint(1, 9999)
+        numbers = generator.randint(1, 9999)
 
         return cls(f"{handle}-{letters}{numbers}")
@@ -42,7 +42,10 @@ class RegexDetector(BaseDetector):
         entities: list[Entity] = []
         for entity_type, pattern in self._regex_patterns.items():
             for match in re.finditer(pattern, input):
-                entities.append(Entity(start=match.start(), end=match.end(), text=match.group(), label=entity_type, score=1.0))
+                # The span and text come straight from the match, so validation can be skipped
+                entities.append(
+                    Entity.model_construct(start=match.start(), end=match.end(), text=match.group(), label=entity_type, score=1.0)
+                )
         return entities
 
     def batch(
@@ -1,9 +1,9 @@
 from collections.abc import Sequence
+from functools import cache
 from logging import Logger, getLogger
 from typing import Any, TypeVar
-from urllib.parse import urljoin
 
-from httpx import Client, HTTPError, Response, get
+from httpx import Client, HTTPError, Limits, Response
 from langchain_core.runnables import RunnableConfig
 from pydantic import BaseModel
 from stamina import retry
@@ -16,6 +16,34 @@ logger: Logger = getLogger(__name__)
 
 T = TypeVar("T", bound=BaseModel)
 
+# Seconds to wait for the GLiNER API, as inference on long texts can take a while
+HTTP_TIMEOUT: float = 60.0
+# Connection limits of the shared client, sized for concurrent evaluation runs against the same API
+HTTP_LIMITS: Limits = Limits(max_connections=32, max_keepalive_connections=16)
+
+
+@cache
+def get_http_client(base_url: str, api_key: str | None = None) -> Client:
+    """
+    Get the HTTP client for a GLiNER API, shared by all detectors using the same API within the process.
+
+    Sharing the client keeps its connections alive across detector instances, so agents created per evaluation task
+    don't pay a new connection setup for every request.
+
+    Args:
+        base_url (str): Base URL of the GLiNER API.
+        api_key (str | None): API key sent as bearer token, if required by the API.
+
+    Returns:
+        Client: The shared HTTP client with connection pooling.
+    """
+    return Client(
+        base_url=base_url,
+        headers={"Authorization": f"Bearer {api_key}"} if api_key else {},
+        timeout=HTTP_TIMEOUT,
+        limits=HTTP_LIMITS,
+    )
+
 
 class RemoteGlinerDetector(BaseDetector):
     """
@@ -25,6 +53,7 @@ class RemoteGlinerDetector(BaseDetector):
     _client: Client
     _threshold: float
     _model_id: str
+    _entity_types: list[str]
 
     def __init__(
         self,
@@ -33,10 +62,10 @@ class RemoteGlinerDetector(BaseDetector):
         supported_entities: set[str] | None = None,
         threshold: float | None = None,
     ) -> None:
-        info_url: str = urljoin(base=base_url, url="/api/info")
-        response: Response = get(info_url)
+        client: Client = get_http_client(base_url, api_key)
+        response: Response = client.get("/api/info")
         response.raise_for_status()
-        info_response: RemoteInfoResponse = RemoteInfoResponse.model_validate(response.json())
+        info_response: RemoteInfoResponse = RemoteInfoResponse.model_validate_json(response.content)
 
         logger.debug(f"GLiNER API Endpoint Info:\n{info_response.model_dump_json(indent=2)}")
 
@@ -49,11 +78,9 @@ class RemoteGlinerDetector(BaseDetector):
             supported_entities=supported_entities,
         )
         self._model_id = info_response.model_id
-        self._client = Client(
-            base_url=base_url,
-            headers={"Authorization": f"Bearer {api_key}"} if api_key else {},
-            timeout=60,
-        )
+        # The label list sent with every request is built once, in a stable order so identical requests have identical payloads
+        self._entity_types = sorted(supported_entities)
+        self._client = client
 
         if threshold is not None:
             if not (0.0 <= threshold <= 1.0):
@@ -73,7 +100,7 @@ class RemoteGlinerDetector(BaseDetector):
             json={
                 "text": input,
                 "threshold": self._threshold,
-                "entity_types": list(self.supported_entities),
+                "entity_types": self._entity_types,
             },
             validation_model=RemoteInvokeResponse,
         )
@@ -90,7 +117,7 @@ class RemoteGlinerDetector(BaseDetector):
             json={
                 "texts": inputs,
                 "threshold": self._threshold,
-                "entity_types": list(self.supported_entities),
+                "entity_types": self._entity_types,
             },
             validation_model=RemoteBatchResponse,
         )
@@ -100,7 +127,8 @@ class RemoteGlinerDetector(BaseDetector):
     def _call_api_and_validate(self, path: str, json: dict[str, Any] | None, validation_model: type[T]) -> T:
         response: Response = self._client.post(path, json=json)
         response.raise_for_status()
-        return validation_model.model_validate(response.json())
+        # Parsing and validating the raw body in one pass avoids building the intermediate Python objects first
+        return validation_model.model_validate_json(response.content)
 
 
 class RemoteInfoResponse(BaseModel):
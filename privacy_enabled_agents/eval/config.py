@@ -30,6 +30,15 @@ class EvalConfig(BaseModel):
         default=10,
         description="Maximum number of conversation turns before forcing completion.",
     )
+    seed: int | None = Field(
+        default=None,
+        description="Seed for generating the evaluation tasks, to run the same tasks again. Random tasks if None.",
+    )
+    max_concurrency: int = Field(
+        default=1,
+        ge=1,
+        description="Maximum number of evaluation runs executed concurrently, each with its own conversation thread.",
+    )
     enable_baseline_comparison: bool = Field(
         default=False,
         description="Whether to run the non-privacy baseline agent for comparison with the privacy-enabled agent.",
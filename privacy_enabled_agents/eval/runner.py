@@ -3,6 +3,7 @@
 import json
 import logging
 import os
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import Any, Literal
 from uuid import uuid4
@@ -80,21 +81,30 @@ def run_evaluation(config_filepath: FilePath) -> None:
     if task_creator is None:
         raise ValueError(f"Unsupported topic: {eval_config.agent_config.topic}")
 
-    for run in tqdm(range(eval_config.eval_runs)):
-        task: EvalTask = task_creator.create_eval_task()
+    tasks: list[EvalTask] = task_creator.create_eval_tasks(eval_config.eval_runs, seed=eval_config.seed)
 
+    def run_task(run: int, task: EvalTask) -> list[dict]:
         # Run with privacy agent
-        privacy_result = _run_single_evaluation(
-            run, task, privacy_agent, structured_user_chat_model, eval_config, agent_type="privacy", chat_model=privacy_chat_model
-        )
-        results.append(privacy_result)
+        task_results: list[dict] = [
+            _run_single_evaluation(
+                run, task, privacy_agent, structured_user_chat_model, eval_config, agent_type="privacy", chat_model=privacy_chat_model
+            )
+        ]
 
         # Run with non-privacy agent (only if baseline comparison is enabled)
         if eval_config.enable_baseline_comparison and non_privacy_agent is not None:
-            non_privacy_result = _run_single_evaluation(
-                run, task, non_privacy_agent, structured_user_chat_model, eval_config, agent_type="non_privacy", chat_model=None
+            task_results.append(
+                _run_single_evaluation(
+                    run, task, non_privacy_agent, structured_user_chat_model, eval_config, agent_type="non_privacy", chat_model=None
+                )
             )
-            results.append(non_privacy_result)
+        return task_results
+
+    # Runs are independent conversations on separate threads, so they can wait on the models concurrently.
+    # Results are collected in run order regardless of which run finishes first.
+    with ThreadPoolExecutor(max_workers=eval_config.max_concurrency, thread_name_prefix="eval-run") as executor:
+        for task_results in tqdm(executor.map(run_task, range(len(tasks)), tasks), total=len(tasks)):
+            results.extend(task_results)
 
     result_df = pd.DataFrame(results)
 
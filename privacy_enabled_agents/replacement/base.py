@@ -61,29 +61,31 @@ class BaseReplacer(ABC):
             str: The text with the entities replaced.
         """
         text_offset: int = 0
+        # Replacements created for this text, stored together once all entities are processed
+        new_replacements: dict[str, str] = {}
+        new_entries: list[tuple[str, str, str]] = []
 
         for entity in entities:
             # Get the replacement for the entity
-            replacement: str | None = self.entity_storage.get_replacement(
+            replacement: str | None = new_replacements.get(entity.text) or self.entity_storage.get_replacement(
                 text=entity.text,
                 thread_id=thread_id,
             )
 
             # If the replacement is not found, create a new one
             if replacement is None:
-                # Create a new replacement and store it
                 replacement = self.create_replacement(entity=entity, thread_id=thread_id)
-                self.entity_storage.put(
-                    text=entity.text,
-                    label=entity.label,
-                    replacement=replacement,
-                    thread_id=thread_id,
-                )
+                new_replacements[entity.text] = replacement
+                new_entries.append((entity.text, entity.label, replacement))
 
             # Replace the entity in the text
             text = text[: entity.start + text_offset] + replacement + text[entity.end + text_offset :]
             text_offset += len(replacement) - len(entity.text)
 
+        # Store all new replacements in one batch, the storage persists them before they are read for restoring
+        if new_entries:
+            self.entity_storage.put_many(new_entries, thread_id=thread_id)
+
         return text
 
     def restore(self, text: str, thread_id: UUID) -> str:
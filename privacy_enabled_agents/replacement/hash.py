@@ -1,6 +1,8 @@
 from typing import Literal
 from uuid import UUID
 
+from xxhash import xxh3_64_hexdigest
+
 from privacy_enabled_agents import Entity
 
 from .base import BaseReplacer
@@ -9,9 +11,11 @@ from .base import BaseReplacer
 class HashReplacer(BaseReplacer):
     """
     Replacer that replaces entities with their hash values.
+
+    Uses the non-cryptographic xxh3 hash, which is fast, stable across processes and yields short 16 character replacements.
     """
 
     _supported_entities: set[str] | Literal["ANY"] = "ANY"  # Allow all entities
 
     def create_replacement(self, entity: Entity, thread_id: UUID) -> str:
-        return hex(hash(entity.text + str(thread_id)))
+        return xxh3_64_hexdigest(entity.text + str(thread_id))
@@ -1,4 +1,5 @@
 from collections.abc import Callable, Sequence
+from threading import Lock
 from typing import Literal
 from uuid import UUID
 
@@ -28,6 +29,8 @@ class PseudonymReplacer(BaseReplacer):
     def __init__(self, entity_storage: BaseEntityStorage, locale: str | Sequence[str] = "de_DE") -> None:
         super().__init__(entity_storage=entity_storage)
         self.faker = Faker(locale=locale)
+        # Seeding and generating must not interleave between threads, or the pseudonyms are no longer reproducible per context
+        self._faker_lock = Lock()
 
         self.replacement_map: dict[str, Callable[[], str]] = {
             "person": lambda: self.faker.name(),
@@ -43,12 +46,13 @@ class PseudonymReplacer(BaseReplacer):
         if entity.label not in self.replacement_map:
             raise ValueError(f"Unsupported entity type: {entity.label}")
 
-        # Seed the faker instance with the context ID to ensure reproducibility as well as uniqueness between different contexts
-        self.faker.seed_instance(thread_id.int)
-
         # Get the replacement function based on the entity label
         replacement_function: Callable[[], str] = self.replacement_map[entity.label]
 
-        # Generate and return the replacement
-        replacement: str = replacement_function()
+        with self._faker_lock:
+            # Seed the faker instance with the context ID to ensure reproducibility as well as uniqueness between different contexts
+            self.faker.seed_instance(thread_id.int)
+
+            # Generate and return the replacement
+            replacement: str = replacement_function()
         return replacement
@@ -1,10 +1,11 @@
+from collections.abc import Callable
+from functools import cache
 from logging import Logger, getLogger
-from typing import Literal
+from typing import TYPE_CHECKING, Literal
 
 from langchain_core.language_models import BaseChatModel
 from langchain_core.runnables import RunnableConfig
 from langgraph.checkpoint.base import BaseCheckpointSaver
-from langgraph.checkpoint.redis import RedisSaver
 from langgraph.graph.state import CompiledStateGraph
 
 from privacy_enabled_agents import PEASettings
@@ -29,6 +30,10 @@ from privacy_enabled_agents.topics import (
 
 from .config import PrivacyAgentConfig, PrivacyAgentConfigDict
 
+if TYPE_CHECKING:
+    from langfuse import Langfuse
+    from langfuse.langchain import CallbackHandler
+
 logger: Logger = getLogger(__name__)
 
 AgentFactoryMap: dict[Literal["basic", "websearch", "finance", "medical", "public-service"], type[AgentFactory]] = {
@@ -40,6 +45,122 @@ AgentFactoryMap: dict[Literal["basic", "websearch", "finance", "medical", "publi
 }
 
 
+# Chat models hold no conversation state, so one instance per model and temperature is shared by all agents of the process,
+# letting the privacy and the baseline agent reuse the same HTTP client and its open connections.
+@cache
+def _get_openai_chat_model(model_name: str, temperature: float) -> BaseChatModel:
+    from langchain_openai import ChatOpenAI
+
+    return ChatOpenAI(model=model_name, temperature=temperature)
+
+
+@cache
+def _get_mistral_chat_model(model_name: str, temperature: float) -> BaseChatModel:
+    from langchain_mistralai import ChatMistralAI
+
+    return ChatMistralAI(model=model_name, temperature=temperature)  # type: ignore
+
+
+def _create_openai_chat_model(config: PrivacyAgentConfig) -> BaseChatModel:
+    return _get_openai_chat_model(config.model_name, config.model_temperature)
+
+
+def _create_mistral_chat_model(config: PrivacyAgentConfig) -> BaseChatModel:
+    return _get_mistral_chat_model(config.model_name, config.model_temperature)
+
+
+def _create_gliner_detector(config: PrivacyAgentConfig, pea_settings: PEASettings, supported_entities: set[str]) -> BaseDetector:
+    return RemoteGlinerDetector(
+        base_url=pea_settings.gliner_api_url,
+        supported_entities=supported_entities,
+        threshold=config.detector_threshold,
+    )
+
+
+def _create_encryption_entity_store(config: PrivacyAgentConfig, pea_settings: PEASettings) -> BaseEntityStorage:
+    if config.replacer != "encryption":
+        raise ValueError("Encryption entity store requires 'encryption' replacer")
+    return EncryptionEntityStorage()
+
+
+def _create_encryption_replacer(config: PrivacyAgentConfig, entity_store: BaseEntityStorage) -> BaseReplacer:
+    if config.entity_store != "encryption":
+        raise ValueError("Encryption replacer requires 'encryption' entity store")
+    return MockEncryptionReplacer(entity_storage=entity_store)
+
+
+def _create_redis_checkpointer(pea_settings: PEASettings) -> BaseCheckpointSaver:
+    from langgraph.checkpoint.redis import RedisSaver
+
+    checkpointer = RedisSaver(
+        redis_url=pea_settings.redis_url,
+        ttl={
+            "default_ttl": 3600,
+            "refresh_on_read": True,
+        },
+    )
+    checkpointer.setup()
+    return checkpointer
+
+
+# Registries mapping the config options to the callables creating the respective components.
+# Third-party integrations are imported lazily inside the callables, so only the selected ones are loaded.
+ChatModelFactoryMap: dict[Literal["openai", "mistral"], Callable[[PrivacyAgentConfig], BaseChatModel]] = {
+    "openai": _create_openai_chat_model,
+    "mistral": _create_mistral_chat_model,
+}
+
+DetectorFactoryMap: dict[Literal["gliner", "regex"], Callable[[PrivacyAgentConfig, PEASettings, set[str]], BaseDetector]] = {
+    "gliner": _create_gliner_detector,
+    "regex": lambda config, pea_settings, supported_entities: RegexDetector(),
+}
+
+EntityStoreFactoryMap: dict[Literal["valkey", "encryption"], Callable[[PrivacyAgentConfig, PEASettings], BaseEntityStorage]] = {
+    "valkey": lambda config, pea_settings: ValkeyEntityStorage(host=pea_settings.valkey_host, port=pea_settings.valkey_port, db=1),
+    "encryption": _create_encryption_entity_store,
+}
+
+ReplacerFactoryMap: dict[
+    Literal["placeholder", "encryption", "hash", "pseudonym"], Callable[[PrivacyAgentConfig, BaseEntityStorage], BaseReplacer]
+] = {
+    "placeholder": lambda config, entity_store: PlaceholderReplacer(entity_storage=entity_store),
+    "encryption": _create_encryption_replacer,
+    "hash": lambda config, entity_store: HashReplacer(entity_storage=entity_store),
+    "pseudonym": lambda config, entity_store: PseudonymReplacer(entity_storage=entity_store),
+}
+
+ConversationStoreFactoryMap: dict[Literal["valkey"], Callable[[PEASettings], BaseConversationStorage]] = {
+    "valkey": lambda pea_settings: ValkeyConversationStorage(host=pea_settings.valkey_host, port=pea_settings.valkey_port, db=1),
+}
+
+CheckpointerFactoryMap: dict[Literal["redis"], Callable[[PEASettings], BaseCheckpointSaver]] = {
+    "redis": _create_redis_checkpointer,
+}
+
+
+@cache
+def _get_langfuse_client() -> "Langfuse":
+    """Get the Langfuse client, authenticated once per process.
+
+    Raises:
+        RuntimeError: If the Langfuse authentication fails. Failures are not cached, so the next call checks again.
+    """
+    from langfuse import get_client
+
+    langfuse: Langfuse = get_client()
+    if not langfuse.auth_check():
+        raise RuntimeError("Langfuse authentication failed. Please check your configuration.")
+    return langfuse
+
+
+@cache
+def _get_langfuse_handler() -> "CallbackHandler":
+    """Get the Langfuse callback handler, shared by all agents of the process as it keeps its state per run."""
+    from langfuse.langchain import CallbackHandler
+
+    return CallbackHandler()
+
+
 def create_privacy_agent(
     config: PrivacyAgentConfig | PrivacyAgentConfigDict = PrivacyAgentConfig(),
 ) -> tuple[CompiledStateGraph, PrivacyEnabledChatModel]:
@@ -61,75 +182,17 @@ def create_privacy_agent(
     # Get general settings
     pea_settings = PEASettings()
 
-    # Agent factory lookup
-    agent_factory: type[AgentFactory] | None = AgentFactoryMap.get(config.topic)
-    if agent_factory is None:
-        raise ValueError(f"Unsupported agent topic: {config.topic}")
+    # Agent factory lookup (the topic is already validated by the config model)
+    agent_factory: type[AgentFactory] = AgentFactoryMap[config.topic]
 
     supported_entities: set[str] = agent_factory.supported_entities()
 
-    # Chat model creation
-    chat_model: BaseChatModel
-    match config.model_provider:
-        case "openai":
-            from langchain_openai import ChatOpenAI
-
-            chat_model = ChatOpenAI(model=config.model_name, temperature=config.model_temperature)
-        case "mistral":
-            from langchain_mistralai import ChatMistralAI
-
-            chat_model = ChatMistralAI(model=config.model_name, temperature=config.model_temperature)  # type: ignore
-        case _:
-            raise ValueError(f"Unsupported model provider: {config.model_provider}")
-
-    # Detector creation
-    detector_instance: BaseDetector
-    match config.detector:
-        case "gliner":
-            detector_instance = RemoteGlinerDetector(
-                base_url=pea_settings.gliner_api_url,
-                supported_entities=supported_entities,
-                threshold=config.detector_threshold,
-            )
-        case "regex":
-            detector_instance = RegexDetector()
-        case _:
-            raise ValueError(f"Unsupported detector: {config.detector}")
-
-    # Entity store creation
-    entity_store_instance: BaseEntityStorage
-    match config.entity_store:
-        case "valkey":
-            entity_store_instance = ValkeyEntityStorage(host=pea_settings.valkey_host, port=pea_settings.valkey_port, db=1)
-        case "encryption":
-            if config.replacer != "encryption":
-                raise ValueError("Encryption entity store requires 'encryption' replacer")
-            entity_store_instance = EncryptionEntityStorage()
-        case _:
-            raise ValueError(f"Unsupported entity store: {config.entity_store}")
-
-    # Replacer creation
-    replacer_instance: BaseReplacer
-    match config.replacer:
-        case "placeholder":
-            replacer_instance = PlaceholderReplacer(entity_storage=entity_store_instance)
-        case "encryption":
-            if config.entity_store != "encryption":
-                raise ValueError("Encryption replacer requires 'encryption' entity store")
-            replacer_instance = MockEncryptionReplacer(entity_storage=entity_store_instance)
-        case "hash":
-            replacer_instance = HashReplacer(entity_storage=entity_store_instance)
-        case "pseudonym":
-            replacer_instance = PseudonymReplacer(entity_storage=entity_store_instance)
-        case _:
-            raise ValueError(f"Unsupported replacer: {config.replacer}")
-
-    conversation_store_instance: BaseConversationStorage
-    match config.conversation_store:
-        case "valkey":
-            conversation_store_instance = ValkeyConversationStorage(host=pea_settings.valkey_host, port=pea_settings.valkey_port, db=1)
-        case _:
-            raise ValueError(f"Unsupported conversation store: {config.conversation_store}")
+    # Component creation
+    chat_model: BaseChatModel = ChatModelFactoryMap[config.model_provider](config)
+    detector_instance: BaseDetector = DetectorFactoryMap[config.detector](config, pea_settings, supported_entities)
+    entity_store_instance: BaseEntityStorage = EntityStoreFactoryMap[config.entity_store](config, pea_settings)
+    replacer_instance: BaseReplacer = ReplacerFactoryMap[config.replacer](config, entity_store_instance)
+    conversation_store_instance: BaseConversationStorage = ConversationStoreFactoryMap[config.conversation_store](pea_settings)
 
     # Create the privacy-enabled chat model
     privacy_chat_model = PrivacyEnabledChatModel(
@@ -140,33 +203,14 @@ def create_privacy_agent(
     )
 
     # Checkpointer creation
-    checkpointer_instance: BaseCheckpointSaver
-    match config.checkpointer:
-        case "redis":
-            checkpointer_instance = RedisSaver(
-                redis_url=pea_settings.redis_url,
-                ttl={
-                    "default_ttl": 3600,
-                    "refresh_on_read": True,
-                },
-            )
-            checkpointer_instance.setup()
-        case _:
-            raise ValueError(f"Unsupported checkpointer: {config.checkpointer}")
+    checkpointer_instance: BaseCheckpointSaver = CheckpointerFactoryMap[config.checkpointer](pea_settings)
 
     # Langfuse setup
     runnable_config: RunnableConfig
     system_prompt: str | None
     if config.langfuse_enabled:
-        from langfuse import Langfuse, get_client  # type: ignore
-        from langfuse.langchain import CallbackHandler
-
-        langfuse: Langfuse = get_client()
-        if not langfuse.auth_check():
-            raise RuntimeError("Langfuse authentication failed. Please check your configuration.")
-
-        langfuse_handler = CallbackHandler()
-        runnable_config = RunnableConfig(callbacks=[langfuse_handler])
+        langfuse: Langfuse = _get_langfuse_client()
+        runnable_config = RunnableConfig(callbacks=[_get_langfuse_handler()])
 
         # System prompt retrieval
         if config.system_prompt is None:
@@ -214,53 +258,21 @@ def create_agent(
     # Get general settings
     pea_settings = PEASettings()
 
-    # Agent factory lookup
-    agent_factory: type[AgentFactory] | None = AgentFactoryMap.get(config.topic)
-    if agent_factory is None:
-        raise ValueError(f"Unsupported agent topic: {config.topic}")
+    # Agent factory lookup (the topic is already validated by the config model)
+    agent_factory: type[AgentFactory] = AgentFactoryMap[config.topic]
 
     # Chat model creation (without privacy wrapper)
-    chat_model: BaseChatModel
-    match config.model_provider:
-        case "openai":
-            from langchain_openai import ChatOpenAI
-
-            chat_model = ChatOpenAI(model=config.model_name, temperature=config.model_temperature)
-        case "mistral":
-            from langchain_mistralai import ChatMistralAI
-
-            chat_model = ChatMistralAI(model=config.model_name, temperature=config.model_temperature)  # type: ignore
-        case _:
-            raise ValueError(f"Unsupported model provider: {config.model_provider}")
+    chat_model: BaseChatModel = ChatModelFactoryMap[config.model_provider](config)
 
     # Checkpointer creation
-    checkpointer_instance: BaseCheckpointSaver
-    match config.checkpointer:
-        case "redis":
-            checkpointer_instance = RedisSaver(
-                redis_url=pea_settings.redis_url,
-                ttl={
-                    "default_ttl": 3600,
-                    "refresh_on_read": True,
-                },
-            )
-            checkpointer_instance.setup()
-        case _:
-            raise ValueError(f"Unsupported checkpointer: {config.checkpointer}")
+    checkpointer_instance: BaseCheckpointSaver = CheckpointerFactoryMap[config.checkpointer](pea_settings)
 
     # Langfuse setup
     runnable_config: RunnableConfig
     system_prompt: str | None
     if config.langfuse_enabled:
-        from langfuse import Langfuse, get_client  # type: ignore
-        from langfuse.langchain import CallbackHandler
-
-        langfuse: Langfuse = get_client()
-        if not langfuse.auth_check():
-            raise RuntimeError("Langfuse authentication failed. Please check your configuration.")
-
-        langfuse_handler = CallbackHandler()
-        runnable_config = RunnableConfig(callbacks=[langfuse_handler])
+        langfuse: Langfuse = _get_langfuse_client()
+        runnable_config = RunnableConfig(callbacks=[_get_langfuse_handler()])
 
         # System prompt retrieval
         if config.system_prompt is None:
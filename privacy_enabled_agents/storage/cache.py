@@ -0,0 +1,72 @@
+from collections import OrderedDict
+from collections.abc import Hashable
+from functools import lru_cache
+from threading import Lock
+from typing import Generic, TypeVar
+from uuid import UUID
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+@lru_cache(maxsize=4096)
+def uuid_str(thread_id: UUID) -> str:
+    """Returns the canonical string form of a UUID, cached as formatting it is comparatively expensive and the same IDs recur."""
+    return str(thread_id)
+
+
+class LRUCache(Generic[K, V]):
+    """
+    Small thread-safe in-process LRU cache used as an L1 in front of the Valkey storages.
+    """
+
+    def __init__(self, maxsize: int = 1024) -> None:
+        """
+        Initializes the cache.
+
+        Args:
+            maxsize (int): Maximum number of entries before the least recently used one is evicted.
+        """
+        self.maxsize = maxsize
+        self._data: OrderedDict[K, V] = OrderedDict()
+        self._lock = Lock()
+
+    def get(self, key: K) -> V | None:
+        """Returns the cached value for the key (marking it as recently used), or None if not cached."""
+        with self._lock:
+            try:
+                self._data.move_to_end(key)
+            except KeyError:
+                return None
+            return self._data[key]
+
+    def put(self, key: K, value: V) -> None:
+        """Stores the value for the key, evicting the least recently used entry if the cache is full."""
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            if len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def pop(self, key: K) -> V | None:
+        """Removes the key from the cache and returns its value, or None if not cached."""
+        with self._lock:
+            return self._data.pop(key, None)
+
+    def clear(self) -> None:
+        """Removes all entries from the cache."""
+        with self._lock:
+            self._data.clear()
+
+    def values(self) -> list[V]:
+        """Returns a snapshot of the cached values, without marking them as recently used."""
+        with self._lock:
+            return list(self._data.values())
+
+    def __contains__(self, key: object) -> bool:
+        with self._lock:
+            return key in self._data
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._data)
@@ -0,0 +1,88 @@
+import socket
+from concurrent.futures import ThreadPoolExecutor
+from functools import cache
+
+from valkey import ConnectionPool, Valkey
+
+# Maximum number of connections per shared pool, to be raised when many threads access the storages concurrently
+MAX_CONNECTIONS: int = 32
+# RESP3 returns native maps and sets, saving client-side reply conversion
+PROTOCOL: int = 3
+# Seconds after which an idle connection is checked before being reused
+HEALTH_CHECK_INTERVAL: int = 30
+
+
+def _keepalive_options() -> dict[int, int]:
+    """TCP keepalive settings, limited to the options supported by the current platform"""
+    options: dict[str, int] = {"TCP_KEEPIDLE": 60, "TCP_KEEPINTVL": 10, "TCP_KEEPCNT": 3}
+    return {getattr(socket, name): value for name, value in options.items() if hasattr(socket, name)}
+
+
+@cache
+def get_connection_pool(host: str, port: int, db: int) -> ConnectionPool:
+    """
+    Get the connection pool for a Valkey database, shared by all storages using the same database within the process.
+
+    Args:
+        host (str): Host where Valkey server is running.
+        port (int): Port of the Valkey server.
+        db (int): Database number to use.
+
+    Returns:
+        ConnectionPool: The shared RESP3 connection pool with TCP keepalive and health checks enabled.
+    """
+    return ConnectionPool(
+        host=host,
+        port=port,
+        db=db,
+        protocol=PROTOCOL,
+        max_connections=MAX_CONNECTIONS,
+        health_check_interval=HEALTH_CHECK_INTERVAL,
+        socket_keepalive=True,
+        socket_keepalive_options=_keepalive_options(),
+    )
+
+
+def shutdown_writer(executor: ThreadPoolExecutor, connection_pool: ConnectionPool) -> None:
+    """
+    Wait for the pending background writes of a storage and disconnect the idle connections of its connection pool.
+
+    Only idle connections are disconnected, as the pool may be shared with other storages.
+
+    Args:
+        executor (ThreadPoolExecutor): The executor running the background writes.
+        connection_pool (ConnectionPool): The connection pool of the storage.
+    """
+    executor.shutdown(wait=True)
+    connection_pool.disconnect(inuse_connections=False)
+
+
+def raise_write_errors(errors: list[BaseException]) -> None:
+    """
+    Raise the errors of failed background writes of a storage, grouped if there is more than one so none of them is lost.
+
+    Args:
+        errors (list[BaseException]): The errors of the failed writes, in the order the writes were submitted.
+    """
+    if len(errors) == 1:
+        raise errors[0]
+    if errors:
+        raise BaseExceptionGroup("Failed to persist background writes", errors)
+
+
+def create_client(host: str, port: int, db: int, **kwargs) -> Valkey:
+    """
+    Create a Valkey client, using the shared connection pool of the database unless custom client arguments are given.
+
+    Args:
+        host (str): Host where Valkey server is running.
+        port (int): Port of the Valkey server.
+        db (int): Database number to use.
+        **kwargs: Additional arguments to pass to Valkey client, which then gets its own connection pool.
+
+    Returns:
+        Valkey: The Valkey client.
+    """
+    if kwargs:
+        return Valkey(host=host, port=port, db=db, **kwargs)
+    return Valkey(connection_pool=get_connection_pool(host, port, db))
@@ -13,6 +13,8 @@ class BaseConversationStorage(ABC):
     what the LLM actually processed vs. what the user sees.
     """
 
+    __slots__ = ()
+
     @abstractmethod
     def store_encrypted_messages(self, thread_id: UUID, messages: list[BaseMessage]) -> None:
         """
@@ -61,3 +63,13 @@ class BaseConversationStorage(ABC):
             True if conversation exists, False otherwise
         """
         pass
+
+    @abstractmethod
+    def flush(self) -> None:
+        """Wait until all pending writes have been persisted."""
+        pass
+
+    @abstractmethod
+    def close(self) -> None:
+        """Close any open connections. Safe to call more than once."""
+        pass
@@ -1,12 +1,26 @@
-import json
 import logging
+import weakref
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from threading import Lock
 from uuid import UUID
 
+import ormsgpack
 from langchain_core.messages import AIMessage, BaseMessage, HumanMessage, SystemMessage, ToolMessage
 from valkey import Valkey
 
+from ..cache import LRUCache, uuid_str
+from ..connection import create_client, raise_write_errors, shutdown_writer
 from .base import BaseConversationStorage
 
+# Message classes by the type field of their serialized form
+MessageTypeMap: dict[str, type[BaseMessage]] = {
+    "ai": AIMessage,
+    "human": HumanMessage,
+    "system": SystemMessage,
+    "tool": ToolMessage,
+}
+
 
 class ValkeyConversationStorage(BaseConversationStorage):
     """
@@ -15,13 +29,30 @@ class ValkeyConversationStorage(BaseConversationStorage):
     This implementation stores conversation messages with privacy-protected content.
     Keys are structured as follows:
 
-    - conv:{thread_id}:messages -> List of all messages for this conversation thread
+    - conv:{thread_id}:messages -> List of all MessagePack encoded messages for this conversation thread
     - convs -> Set of all conversation thread IDs
+
+    Full conversations are additionally cached as decoded messages in an in-process LRU cache,
+    as the same history is read over and over within an agent loop.
+
+    Conversations written by earlier versions (JSON messages prepended with LPUSH) are not readable
+    by this layout, so the conversation store has to be cleared when upgrading.
     """
 
+    __slots__ = (
+        "client",
+        "_executor",
+        "_writes",
+        "_write_errors",
+        "_write_lock",
+        "_finalizer",
+        "_message_cache",
+        "__weakref__",
+    )
+
     client: Valkey
 
-    def __init__(self, host: str = "localhost", port: int = 6379, db: int = 0, **kwargs):
+    def __init__(self, host: str = "localhost", port: int = 6379, db: int = 0, cache_size: int = 256, **kwargs):
         """
         Initializes the Valkey conversation storage.
 
@@ -29,42 +60,39 @@ class ValkeyConversationStorage(BaseConversationStorage):
             host (str): Host where Valkey server is running.
             port (int): Port of the Valkey server.
             db (int): Database number to use (should match entity storage for same instance).
-            **kwargs: Additional arguments to pass to Valkey client.
+            cache_size (int): Maximum number of conversations kept decoded in the in-process cache.
+            **kwargs: Additional arguments to pass to Valkey client, which then no longer uses the shared connection pool.
         """
-        self.client = Valkey(host=host, port=port, db=db, **kwargs)
-
-    def _conversation_messages_key(self, thread_id: UUID) -> str:
-        """Generate key for all messages in a conversation thread"""
-        return f"conv:{thread_id}:messages"
+        self.client = create_client(host, port, db, **kwargs)
+        # Writes are executed in the background by a single worker, so they stay in order
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="valkey-conversation-writer")
+        # Submitted writes per conversation, in submission order until their outcome has been checked
+        self._writes: dict[UUID, deque[Future[list]]] = {}
+        # Errors of failed writes per conversation, until an operation on that conversation or flush() raises them
+        self._write_errors: dict[UUID, list[BaseException]] = {}
+        self._write_lock = Lock()
+        # Wait for pending writes and disconnect the connection pool once the storage is garbage collected or closed
+        self._finalizer = weakref.finalize(self, shutdown_writer, self._executor, self.client.connection_pool)
+        self._message_cache: LRUCache[UUID, list[BaseMessage]] = LRUCache(maxsize=cache_size)
+
+    def _conversation_messages_key(self, thread_id: UUID) -> bytes:
+        """Generate key for all messages in a conversation thread, the UUID formatting is cached by uuid_str"""
+        return f"conv:{uuid_str(thread_id)}:messages".encode()
 
     def _conversations_set_key(self) -> str:
         """Generate key for the set of all conversation thread IDs"""
         return "convs"
 
-    def _serialize_message(self, message: BaseMessage) -> str:
-        """Serialize a message to JSON string"""
-        return message.model_dump_json()
-
-    def _deserialize_message(self, message_str: str) -> BaseMessage:
-        """Deserialize a message from JSON string"""
-        data = json.loads(message_str)
-        message_type: str = data["type"]
-
-        # Create the appropriate message type using match-case (Python 3.10+)
-        match message_type:
-            case "ai":
-                msg = AIMessage.model_validate_json(message_str)
-            case "human":
-                msg = HumanMessage.model_validate_json(message_str)
-            case "system":
-                msg = SystemMessage.model_validate_json(message_str)
-            case "tool":
-                msg = ToolMessage.model_validate_json(message_str)
-            case _:
-                # Fallback to BaseMessage for unknown types
-                msg = BaseMessage.model_validate_json(message_str)
-
-        return msg
+    def _serialize_message(self, message: BaseMessage) -> bytes:
+        """Serialize a message to MessagePack bytes, packing the pydantic model natively instead of dumping it to a dict first"""
+        return ormsgpack.packb(message, option=ormsgpack.OPT_SERIALIZE_PYDANTIC)
+
+    def _deserialize_message(self, message_str: bytes) -> BaseMessage:
+        """Deserialize a message from MessagePack bytes"""
+        data: dict = ormsgpack.unpackb(message_str)
+        # Create the appropriate message type, falling back to BaseMessage for unknown types
+        message_class: type[BaseMessage] = MessageTypeMap.get(data["type"], BaseMessage)
+        return message_class.model_validate(data)
 
     def store_encrypted_messages(self, thread_id: UUID, messages: list[BaseMessage]) -> None:
         """
@@ -83,17 +111,25 @@ class ValkeyConversationStorage(BaseConversationStorage):
         # Store in conversation-specific key
         conversation_key = self._conversation_messages_key(thread_id)
 
-        # Use pipeline for atomic operations
-        pipe = self.client.pipeline()
+        # Use a non-transactional pipeline, as the writes need no atomicity across keys
+        pipe = self.client.pipeline(transaction=False)
 
-        # Add messages to conversation
-        pipe.lpush(conversation_key, *serialized_messages)
+        # Append messages to conversation, keeping the list in chronological order
+        pipe.rpush(conversation_key, *serialized_messages)
 
         # Add to conversations set
-        pipe.sadd(self._conversations_set_key(), str(thread_id))
+        pipe.sadd(self._conversations_set_key(), uuid_str(thread_id))
 
-        # Execute pipeline
-        pipe.execute()
+        with self._write_lock:
+            # Keep a cached conversation up to date instead of invalidating it, before the write is submitted,
+            # so a failure of the write always drops the updated entry
+            cached_messages: list[BaseMessage] | None = self._message_cache.get(thread_id)
+            if cached_messages is not None:
+                self._message_cache.put(thread_id, cached_messages + messages)
+
+            # Execute pipeline in the background, callers needing the write to be persisted use flush()
+            self._writes.setdefault(thread_id, deque()).append(self._executor.submit(pipe.execute))
+            self._reap_writes()
 
     def get_encrypted_messages(self, thread_id: UUID, limit: int | None = None) -> list[BaseMessage]:
         """
@@ -106,26 +142,45 @@ class ValkeyConversationStorage(BaseConversationStorage):
         Returns:
             List of messages with privacy placeholders
         """
+        # Drop cached conversations whose writes failed in the meantime, before serving from the cache
+        if self._writes:
+            with self._write_lock:
+                self._reap_writes()
+
+        # Serve the conversation from the cache if possible, which already includes pending writes
+        cached_messages: list[BaseMessage] | None = self._message_cache.get(thread_id)
+        if cached_messages is not None:
+            return cached_messages[-limit:] if limit else list(cached_messages)
+
+        # Make sure pending writes are visible
+        self._flush_conversation(thread_id)
         conversation_key = self._conversation_messages_key(thread_id)
 
-        # Get messages (most recent first due to lpush)
-        if limit is None:
-            message_strs: list[bytes] = self.client.lrange(conversation_key, 0, -1)  # type: ignore
-        else:
-            message_strs = self.client.lrange(conversation_key, 0, limit - 1)  # type: ignore
-
-        # Deserialize messages
-        messages = []
-        for msg_str in message_strs:
-            try:
-                messages.append(self._deserialize_message(msg_str.decode("utf-8")))
-            except (json.JSONDecodeError, KeyError) as e:
-                # Skip invalid messages
-                logging.warning(f"Warning: Failed to deserialize message: {e}")
-                continue
-
-        # Reverse to get chronological order (oldest first)
-        return list(reversed(messages))
+        # Read and cache under the lock of the writers, so no message stored in between is missing from the cached conversation
+        with self._write_lock:
+            # Get messages (oldest first due to rpush), limited to the most recent ones if requested
+            if limit is None:
+                message_strs: list[bytes] = self.client.lrange(conversation_key, 0, -1)  # type: ignore
+            else:
+                message_strs = self.client.lrange(conversation_key, -limit, -1)  # type: ignore
+
+            # Deserialize messages
+            messages: list[BaseMessage] = []
+            for msg_str in message_strs:
+                try:
+                    messages.append(self._deserialize_message(msg_str))
+                except (ormsgpack.MsgpackDecodeError, KeyError) as e:
+                    # Skip invalid messages
+                    logging.warning(f"Warning: Failed to deserialize message: {e}")
+                    continue
+
+            # Only complete conversations are cached, and only if no write was submitted since the flush,
+            # as the read may or may not include the messages of a write still in progress
+            self._reap_writes()
+            if limit is None and thread_id not in self._writes:
+                self._message_cache.put(thread_id, messages)
+                return list(messages)
+        return messages
 
     def clear_conversation(self, thread_id: UUID) -> None:
         """
@@ -134,12 +189,15 @@ class ValkeyConversationStorage(BaseConversationStorage):
         Args:
             thread_id: UUID identifying the specific conversation thread
         """
+        # Make sure no pending write recreates the conversation after it was cleared
+        self._flush_conversation(thread_id)
+        self._message_cache.pop(thread_id)
         pipe = self.client.pipeline()
 
         # Clear conversation data
         conversation_key = self._conversation_messages_key(thread_id)
         pipe.delete(conversation_key)
-        pipe.srem(self._conversations_set_key(), str(thread_id))
+        pipe.srem(self._conversations_set_key(), uuid_str(thread_id))
 
         pipe.execute()
 
@@ -153,6 +211,66 @@ class ValkeyConversationStorage(BaseConversationStorage):
         Returns:
             True if conversation exists, False otherwise
         """
+        # Make sure pending writes are visible
+        self._flush_conversation(thread_id)
         conversation_key = self._conversation_messages_key(thread_id)
         result: int = self.client.exists(conversation_key)  # type: ignore
         return result > 0
+
+    def _reap_writes(self) -> None:
+        """Check the outcome of the writes finished so far without waiting, must be called with the write lock held"""
+        for thread_id, writes in list(self._writes.items()):
+            while writes and writes[0].done():
+                self._check_write(writes.popleft(), thread_id)
+            if not writes:
+                del self._writes[thread_id]
+
+    def _check_write(self, write: Future[list], thread_id: UUID) -> None:
+        """
+        Check a finished write and, if it failed, drop the cached conversation, which already included the messages that were not persisted.
+
+        The error is kept with its conversation until an operation on it or flush() raises it, must be called with the write lock held.
+        """
+        error: BaseException | None = write.exception()
+        if error is None:
+            return
+        self._message_cache.pop(thread_id)
+        self._write_errors.setdefault(thread_id, []).append(error)
+
+    def _flush_conversation(self, thread_id: UUID) -> None:
+        """Wait until the pending writes of a conversation have been persisted, raising the errors of its failed writes once"""
+        with self._write_lock:
+            writes: deque[Future[list]] = self._writes.pop(thread_id, deque())
+
+        # Writes are executed in order by a single worker, which does not need the lock
+        wait(writes)
+        with self._write_lock:
+            for write in writes:
+                self._check_write(write, thread_id)
+            errors: list[BaseException] = self._write_errors.pop(thread_id, [])
+
+        raise_write_errors(errors)
+
+    def flush(self) -> None:
+        """Wait until all pending writes have been persisted, raising the errors of all failed writes once."""
+        with self._write_lock:
+            writes: dict[UUID, deque[Future[list]]] = self._writes
+            self._writes = {}
+
+        wait([write for thread_writes in writes.values() for write in thread_writes])
+        with self._write_lock:
+            for thread_id, thread_writes in writes.items():
+                for write in thread_writes:
+                    self._check_write(write, thread_id)
+            errors: list[BaseException] = [error for thread_errors in self._write_errors.values() for error in thread_errors]
+            self._write_errors.clear()
+
+        raise_write_errors(errors)
+
+    def close(self) -> None:
+        """Wait for pending writes, raising the error of a failed one, and close any open connections."""
+        try:
+            if self._finalizer.alive:
+                self.flush()
+        finally:
+            self._finalizer()
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from collections.abc import Iterator
+from collections.abc import Iterable, Iterator
 from uuid import UUID
 
 
@@ -8,6 +8,8 @@ class BaseEntityStorage(ABC):
     Abstract base class for implementing various storage techniques for storing triples of replacements and their original values and labels.
     """
 
+    __slots__ = ()
+
     @abstractmethod
     def put(self, text: str, label: str, replacement: str, thread_id: UUID) -> None:
         """
@@ -21,6 +23,18 @@ class BaseEntityStorage(ABC):
         """
         pass
 
+    @abstractmethod
+    def put_many(self, entries: Iterable[tuple[str, str, str]], thread_id: UUID) -> None:
+        """
+        Stores multiple triples of text, label, and replacement at once.
+        Implementations may buffer the writes until flush() is called.
+
+        Args:
+            entries (Iterable[tuple[str, str, str]]): The (text, label, replacement) triples to store.
+            thread_id (UUID): UUID that identifies the specific context (e.g. a conversation).
+        """
+        pass
+
     @abstractmethod
     def inc_label_counter(self, label: str, thread_id: UUID) -> int:
         """
@@ -151,7 +165,12 @@ class BaseEntityStorage(ABC):
         """
         pass
 
+    @abstractmethod
+    def flush(self) -> None:
+        """Writes any pending buffered changes to the backend."""
+        pass
+
     @abstractmethod
     def close(self) -> None:
-        """Close any open connections."""
+        """Flush pending changes and close any open connections. Safe to call more than once."""
         pass
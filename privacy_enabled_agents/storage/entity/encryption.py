@@ -1,40 +1,72 @@
-from collections.abc import Iterator
+import os
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from collections.abc import Iterable, Iterator
+from functools import lru_cache
 from uuid import UUID
 
-from cryptography.fernet import Fernet
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+from cryptography.hazmat.primitives.hashes import SHA256
+from cryptography.hazmat.primitives.kdf.hkdf import HKDF
 
 from .base import BaseEntityStorage
 
+# Size of the random nonce prefixed to each ciphertext, as recommended for AES-GCM
+NONCE_SIZE: int = 12
+
+
+@lru_cache(maxsize=1024)
+def _cipher_for(thread_id: UUID) -> AESGCM:
+    """
+    Get the AES-GCM cipher of a context, cached as the same context is used for a whole conversation.
+
+    A 256 bit key is derived from the 16 bytes of the thread_id with HKDF.
+
+    Args:
+        thread_id (UUID): UUID that identifies the specific context (e.g. a conversation).
+
+    Returns:
+        AESGCM: The cipher for the context.
+    """
+    key: bytes = HKDF(algorithm=SHA256(), length=32, salt=None, info=b"privacy-enabled-agents").derive(thread_id.bytes)
+    return AESGCM(key)
+
 
 class EncryptionEntityStorage(BaseEntityStorage):
     """Mock encryption storage class because data is encrypted in the replacement instead of stored."""
 
+    __slots__ = ("_storage",)
+
     def __init__(self):
-        self._storage: dict[UUID, list[str]] = {}
+        # Replacements per context as insertion-ordered dicts, for O(1) removal while keeping their order
+        self._storage: dict[UUID, dict[str, None]] = {}
 
     def put(self, text: str, label: str, replacement: str, thread_id: UUID) -> None:
         raise NotImplementedError("EncryptionStorage does not support put operation.")
 
+    def put_many(self, entries: Iterable[tuple[str, str, str]], thread_id: UUID) -> None:
+        raise NotImplementedError("EncryptionStorage does not support put_many operation.")
+
     def inc_label_counter(self, label: str, thread_id: UUID) -> int:
         raise NotImplementedError("EncryptionStorage does not support inc_label_counter operation.")
 
     def get_text(self, replacement: str, thread_id: UUID) -> tuple[str, str]:
-        # Create a fernet object using the thread_id as key
-        fernet = Fernet(key=thread_id.bytes)
-        # Decrypt the replacement text
-        decrypted_text = fernet.decrypt(replacement.encode())
+        # Split the nonce from the ciphertext
+        data: bytes = urlsafe_b64decode(replacement)
+        nonce, ciphertext = data[:NONCE_SIZE], data[NONCE_SIZE:]
+        # Decrypt the replacement text with the cipher of the thread_id
+        decrypted_text: bytes = _cipher_for(thread_id).decrypt(nonce, ciphertext, None)
         # Find the label in the storage
         return decrypted_text.decode(), "unknown"
 
     def get_replacement(self, text: str, thread_id: UUID) -> str:
-        # Create a fernet object using the thread_id as key
-        fernet = Fernet(key=thread_id.bytes)
-        # Encrypt the text
-        encrypted_text: bytes = fernet.encrypt(text.encode())
+        # Encrypt the text with the cipher of the thread_id and a fresh nonce
+        nonce: bytes = os.urandom(NONCE_SIZE)
+        encrypted_text: bytes = _cipher_for(thread_id).encrypt(nonce, text.encode(), None)
+        # Prefix the nonce and encode as text, as the replacement is placed in the message content
+        replacement: str = urlsafe_b64encode(nonce + encrypted_text).decode()
         # Store the encrypted text in the storage
-        self._storage.setdefault(thread_id, []).append(encrypted_text.decode())
-        # Return the encrypted text as a string
-        return encrypted_text.decode()
+        self._storage.setdefault(thread_id, {})[replacement] = None
+        return replacement
 
     def clear(self, thread_id: UUID | None = None) -> None:
         if thread_id is None:
@@ -43,13 +75,16 @@ class EncryptionEntityStorage(BaseEntityStorage):
             self._storage.pop(thread_id, None)
 
     def delete(self, replacement: str, thread_id: UUID) -> None:
-        self._storage.get(thread_id, []).remove(replacement)
+        replacements: dict[str, None] = self._storage.get(thread_id, {})
+        if replacement not in replacements:
+            raise ValueError(f"Replacement '{replacement}' not found in context {thread_id}")
+        del replacements[replacement]
 
     def exists(self, replacement: str, thread_id: UUID) -> bool:
         raise NotImplementedError("EncryptionStorage does not support exists operation.")
 
     def list_replacements(self, thread_id: UUID) -> list[str]:
-        return self._storage.get(thread_id, [])
+        return list(self._storage.get(thread_id, {}))
 
     def get_all_context_data(self, thread_id: UUID) -> dict[str, tuple[str, str]]:
         raise NotImplementedError("EncryptionStorage does not support get_all_context_data operation.")
@@ -65,5 +100,8 @@ class EncryptionEntityStorage(BaseEntityStorage):
             for replacement in replacements:
                 yield (replacement, "unknown", "unknown", thread_id)
 
+    def flush(self) -> None:
+        pass
+
     def close(self) -> None:
-        del self._storage
+        self._storage.clear()
@@ -1,29 +1,122 @@
-import json
-from collections.abc import Iterator
+import weakref
+from collections import deque
+from collections.abc import Iterable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from threading import Lock
 from uuid import UUID
 
+import ormsgpack
 from valkey import Valkey
+from valkey.client import Pipeline
+from valkey.commands.core import Script
 
+from ..cache import LRUCache, uuid_str
+from ..connection import create_client, raise_write_errors, shutdown_writer
 from .base import BaseEntityStorage
 
+# Number of elements requested per SCAN/SSCAN/HSCAN call and keys removed per UNLINK
+SCAN_BATCH_SIZE: int = 500
+# Number of queued commands after which pending pipelined writes are handed to the background writer
+FLUSH_BATCH_SIZE: int = 512
+
+# Key of the counter of entries across all contexts
+ENTRIES_COUNTER_KEY: str = "stats:entries"
+
+# Stores a replacement and its reverse lookup, counts it if it is new, and registers the context if a thread_id is passed
+# KEYS: replacements hash, text-to-replacement hash, set of all contexts, entries counter
+# ARGV: replacement, packed data, text, thread_id (optional)
+PUT_SCRIPT: str = """
+if redis.call('HSET', KEYS[1], ARGV[1], ARGV[2]) == 1 then
+    redis.call('INCR', KEYS[4])
+end
+redis.call('HSET', KEYS[2], ARGV[3], ARGV[1])
+if ARGV[4] then
+    redis.call('SADD', KEYS[3], ARGV[4])
+end
+"""
+
+# Removes a replacement and its reverse lookup and uncounts it, returning its packed data or nil if it does not exist
+# KEYS: replacements hash, text-to-replacement hash, entries counter
+# ARGV: replacement
+DELETE_SCRIPT: str = """
+local data = redis.call('HGET', KEYS[1], ARGV[1])
+if not data then
+    return false
+end
+redis.call('HDEL', KEYS[1], ARGV[1])
+redis.call('HDEL', KEYS[2], cmsgpack.unpack(data)[1])
+redis.call('DECR', KEYS[3])
+return data
+"""
+
+# Removes the replacements of a context and its reverse lookups, uncounts them and unregisters the context
+# KEYS: replacements hash, text-to-replacement hash, set of all contexts, entries counter
+# ARGV: thread_id
+CLEAR_SCRIPT: str = """
+local num_entries = redis.call('HLEN', KEYS[1])
+redis.call('UNLINK', KEYS[1], KEYS[2])
+redis.call('SREM', KEYS[3], ARGV[1])
+redis.call('DECRBY', KEYS[4], num_entries)
+"""
+
+
+def _encode_entity(text: str, label: str) -> bytes:
+    """Pack the original text and label of a replacement as a MessagePack array"""
+    return ormsgpack.packb((text, label))
+
+
+def _decode_entity(data: bytes) -> tuple[str, str]:
+    """Unpack the original text and label of a replacement from the MessagePack array also read by DELETE_SCRIPT"""
+    text, label = ormsgpack.unpackb(data)
+    return text, label
+
 
 class ValkeyEntityStorage(BaseEntityStorage):
     """
     Implementation of BaseEntityStorage using Valkey as the backend.
 
-    This implementation uses hash sets in Valkey to store replacements with their original
+    This implementation uses hashes in Valkey to store replacements with their original
     text and label for each context. Keys are structured as follows:
 
-    - ctx:{thread_id}:reps -> Set of all replacements for this context
-    - ctx:{thread_id}:rep:{replacement} -> JSON string containing {"text": original_text, "label": original_label}
+    - ctx:{thread_id}:reps -> Hash map mapping each replacement to a MessagePack array [original_text, original_label]
     - ctx:{thread_id}:tex2rep -> Hash map mapping original_text to replacement
     - ctx:{thread_id}:lc:{label} -> Label counter for this label
     - ctxs -> Set of all context IDs
+    - stats:entries -> Counter of entries across all contexts
+
+    Text to replacement lookups are additionally cached in a per-context in-process LRU cache,
+    as the same entities tend to be detected over and over within a conversation.
     """
 
+    __slots__ = (
+        "client",
+        "_finalizer",
+        "_cache_size",
+        "_replacement_cache",
+        "_pending_pipeline",
+        "_pending_texts",
+        "_pipeline_lock",
+        "_executor",
+        "_writes",
+        "_write_errors",
+        "_known_contexts",
+        "_put_script",
+        "_delete_script",
+        "_clear_script",
+        "__weakref__",
+    )
+
     client: Valkey
 
-    def __init__(self, host: str = "localhost", port: int = 6379, db: int = 0, **kwargs):
+    def __init__(
+        self,
+        host: str = "localhost",
+        port: int = 6379,
+        db: int = 0,
+        cache_size: int = 1024,
+        context_cache_size: int = 256,
+        **kwargs,
+    ):
         """
         Initializes the Valkey storage.
 
@@ -31,42 +124,165 @@ class ValkeyEntityStorage(BaseEntityStorage):
             host (str): Host where Valkey server is running.
             port (int): Port of the Valkey server.
             db (int): Database number to use.
-            **kwargs: Additional arguments to pass to Valkey client.
+            cache_size (int): Maximum number of cached text to replacement lookups per context.
+            context_cache_size (int): Maximum number of contexts with cached lookups, the least recently used one is dropped first.
+            **kwargs: Additional arguments to pass to Valkey client, which then no longer uses the shared connection pool.
         """
-        self.client = Valkey(host=host, port=port, db=db, **kwargs)
-
-    def _replacement_key(self, thread_id: UUID, replacement: str) -> str:
-        """Generate key for a specific replacement in a context"""
-        return f"ctx:{thread_id}:rep:{replacement}"
-
-    def _replacements_set_key(self, thread_id: UUID) -> str:
-        """Generate key for the set of replacements in a context"""
-        return f"ctx:{thread_id}:reps"
-
-    def _text_to_replacement_key(self, thread_id: UUID) -> str:
+        self.client = create_client(host, port, db, **kwargs)
+        # Both caches are bounded by the number of contexts, as long-running processes see a new context per conversation
+        self._cache_size = cache_size
+        self._replacement_cache: LRUCache[UUID, LRUCache[str, str]] = LRUCache(maxsize=context_cache_size)
+        # Writes queued by put_many, created lazily and sent in batches of at most FLUSH_BATCH_SIZE commands
+        self._pending_pipeline: Pipeline | None = None
+        # Cached texts written by the pending pipeline, evicted again if its batch fails
+        self._pending_texts: list[str] = []
+        self._pipeline_lock = Lock()
+        # Batches are executed in the background by a single worker, so they stay in order
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="valkey-entity-writer")
+        # Submitted batches per context with their cached texts, in submission order until their outcome has been checked
+        self._writes: dict[UUID, deque[tuple[Future[list], list[str]]]] = {}
+        # Errors of failed batches per context, until an operation on that context or flush() raises them
+        self._write_errors: dict[UUID, list[BaseException]] = {}
+        # Wait for pending writes and disconnect the idle connections once the storage is garbage collected or closed
+        self._finalizer = weakref.finalize(self, shutdown_writer, self._executor, self.client.connection_pool)
+        # Contexts recently added to the set of all contexts by this instance, a dropped one is just registered again
+        self._known_contexts: LRUCache[UUID, bool] = LRUCache(maxsize=context_cache_size)
+        # Scripts are called with EVALSHA, falling back to loading them if the server does not know them yet
+        self._put_script: Script = self.client.register_script(PUT_SCRIPT)
+        self._delete_script: Script = self.client.register_script(DELETE_SCRIPT)
+        self._clear_script: Script = self.client.register_script(CLEAR_SCRIPT)
+
+    def _context_cache(self, thread_id: UUID) -> LRUCache[str, str]:
+        """Get the text to replacement cache of a context, creating it if the context has no cached lookups"""
+        cache: LRUCache[str, str] | None = self._replacement_cache.get(thread_id)
+        if cache is None:
+            cache = LRUCache(maxsize=self._cache_size)
+            self._replacement_cache.put(thread_id, cache)
+        return cache
+
+    def _context_prefix(self, thread_id: UUID) -> bytes:
+        """Get the key prefix of a context, the UUID formatting is cached by uuid_str"""
+        return f"ctx:{uuid_str(thread_id)}:".encode()
+
+    def _replacements_key(self, thread_id: UUID) -> bytes:
+        """Generate key for the hash mapping replacements to their data in a context"""
+        return self._context_prefix(thread_id) + b"reps"
+
+    def _text_to_replacement_key(self, thread_id: UUID) -> bytes:
         """Generate key for the hash mapping text to replacement in a context"""
-        return f"ctx:{thread_id}:tex2rep"
+        return self._context_prefix(thread_id) + b"tex2rep"
 
-    def _label_counter_key(self, thread_id: UUID, label: str) -> str:
+    def _label_counter_key(self, thread_id: UUID, label: str) -> bytes:
         """Generate key for the label counter in a context"""
-        return f"ctx:{thread_id}:lc:{label}"
+        return self._context_prefix(thread_id) + b"lc:" + label.encode()
 
     def put(self, text: str, label: str, replacement: str, thread_id: UUID) -> None:
-        # Create a JSON string with the original text and label
-        data: str = json.dumps({"text": text, "label": label})
-
-        # Use a pipeline for atomic operations
-        with self.client.pipeline() as pipe:
-            # Store the replacement data
-            pipe.set(self._replacement_key(thread_id, replacement), data)
-            # Add the replacement to the set of replacements for this context
-            pipe.sadd(self._replacements_set_key(thread_id), replacement)
-            # Add to reverse lookup index: map text to replacement
-            pipe.hset(self._text_to_replacement_key(thread_id), text, replacement)
-            # Add the thread_id to the set of all contexts
-            pipe.sadd("ctxs", str(thread_id))
-            # Execute all commands
-            pipe.execute()
+        # Keep the order with batched writes of the same replacements
+        self._flush_context(thread_id)
+        # Pack the original text and label
+        data: bytes = _encode_entity(text, label)
+
+        # Store the replacement data and the reverse lookup atomically in a single script call
+        args: list[str | bytes] = [replacement, data, text]
+        # Add the thread_id to the set of all contexts, unless already done
+        if thread_id not in self._known_contexts:
+            args.append(uuid_str(thread_id))
+        self._put_script(keys=self._put_script_keys(thread_id), args=args)
+
+        self._known_contexts.put(thread_id, True)
+        self._context_cache(thread_id).put(text, replacement)
+
+    def put_many(self, entries: Iterable[tuple[str, str, str]], thread_id: UUID) -> None:
+        # The writes are queued in a non-transactional pipeline that is executed in the background without waiting
+        # for the server, while replacement lookups are served from the cache right away and reads flush first
+        cache: LRUCache[str, str] = self._context_cache(thread_id)
+        keys: list[str | bytes] = self._put_script_keys(thread_id)
+        with self._pipeline_lock:
+            try:
+                for text, label, replacement in entries:
+                    if self._pending_pipeline is None:
+                        self._pending_pipeline = self.client.pipeline(transaction=False)
+                    args: list[str | bytes] = [replacement, _encode_entity(text, label), text]
+                    # Register the context with the first entry, unless already done
+                    if thread_id not in self._known_contexts:
+                        args.append(uuid_str(thread_id))
+                        self._known_contexts.put(thread_id, True)
+                    self._put_script(keys=keys, args=args, client=self._pending_pipeline)
+                    cache.put(text, replacement)
+                    self._pending_texts.append(text)
+
+                    if len(self._pending_texts) >= FLUSH_BATCH_SIZE:
+                        self._submit_pending(thread_id)
+            finally:
+                # Submitted even if an entry failed, so every batch holds the writes of a single context
+                self._submit_pending(thread_id)
+
+    def _put_script_keys(self, thread_id: UUID) -> list[str | bytes]:
+        """Keys passed to the put and clear scripts for a context"""
+        return [self._replacements_key(thread_id), self._text_to_replacement_key(thread_id), "ctxs", ENTRIES_COUNTER_KEY]
+
+    def _submit_pending(self, thread_id: UUID) -> None:
+        """Hand the pending pipelined writes of a context to the background writer, must be called with the pipeline lock held"""
+        if self._pending_pipeline is not None and self._pending_texts:
+            write: Future[list] = self._executor.submit(self._pending_pipeline.execute)
+            self._writes.setdefault(thread_id, deque()).append((write, self._pending_texts))
+            self._pending_texts = []
+        self._pending_pipeline = None
+        self._reap_writes()
+
+    def _reap_writes(self) -> None:
+        """Check the outcome of the batches finished so far without waiting, must be called with the pipeline lock held"""
+        for thread_id, writes in list(self._writes.items()):
+            while writes and writes[0][0].done():
+                self._check_write(*writes.popleft(), thread_id)
+            if not writes:
+                del self._writes[thread_id]
+
+    def _check_write(self, write: Future[list], texts: list[str], thread_id: UUID) -> None:
+        """
+        Check a finished batch and, if it failed, evict its texts from the cache so they are not served without being persisted.
+
+        The error is kept with its context until an operation on it or flush() raises it, and the context is registered again
+        with its next put, must be called with the pipeline lock held.
+        """
+        error: BaseException | None = write.exception()
+        if error is None:
+            return
+        cache: LRUCache[str, str] | None = self._replacement_cache.get(thread_id)
+        if cache is not None:
+            for text in texts:
+                cache.pop(text)
+        self._known_contexts.pop(thread_id)
+        self._write_errors.setdefault(thread_id, []).append(error)
+
+    def _flush_context(self, thread_id: UUID) -> None:
+        """Wait until the pending batches of a context have been persisted, raising the errors of its failed batches once"""
+        with self._pipeline_lock:
+            writes: deque[tuple[Future[list], list[str]]] = self._writes.pop(thread_id, deque())
+
+        # Batches are executed in order by a single worker, which does not need the lock
+        wait([write for write, _ in writes])
+        with self._pipeline_lock:
+            for write, texts in writes:
+                self._check_write(write, texts, thread_id)
+            errors: list[BaseException] = self._write_errors.pop(thread_id, [])
+
+        raise_write_errors(errors)
+
+    def flush(self) -> None:
+        with self._pipeline_lock:
+            writes: dict[UUID, deque[tuple[Future[list], list[str]]]] = self._writes
+            self._writes = {}
+
+        wait([write for context_writes in writes.values() for write, _ in context_writes])
+        with self._pipeline_lock:
+            for thread_id, context_writes in writes.items():
+                for write, texts in context_writes:
+                    self._check_write(write, texts, thread_id)
+            errors: list[BaseException] = [error for context_errors in self._write_errors.values() for error in context_errors]
+            self._write_errors.clear()
+
+        raise_write_errors(errors)
 
     def inc_label_counter(self, label: str, thread_id: UUID) -> int:
         # Increment the label counter and get the new value
@@ -74,154 +290,164 @@ class ValkeyEntityStorage(BaseEntityStorage):
         return new_value
 
     def get_text(self, replacement: str, thread_id: UUID) -> tuple[str, str]:
-        data: str | None = self.client.get(self._replacement_key(thread_id, replacement))  # type: ignore
+        self._flush_context(thread_id)
+        data: bytes | None = self.client.hget(self._replacements_key(thread_id), replacement)  # type: ignore
         if data is None:
             raise ValueError(f"Replacement '{replacement}' not found in context {thread_id}")
 
-        # Parse the JSON string to get the original text and label
-        parsed_data = json.loads(data)
-        return parsed_data["text"], parsed_data["label"]
+        return _decode_entity(data)
 
     def get_replacement(self, text: str, thread_id: UUID) -> str | None:
+        # Evict the entries of batches that failed in the meantime, before serving from the cache
+        if self._writes:
+            with self._pipeline_lock:
+                self._reap_writes()
+
+        # Check the in-process cache first
+        cache: LRUCache[str, str] = self._context_cache(thread_id)
+        cached_replacement: str | None = cache.get(text)
+        if cached_replacement is not None:
+            return cached_replacement
+
         # Use the reverse lookup index to directly get the replacement
+        self._flush_context(thread_id)
         replacement: bytes | None = self.client.hget(self._text_to_replacement_key(thread_id), text)  # type: ignore
         if replacement:
-            return replacement.decode("utf-8")
+            decoded_replacement: str = replacement.decode("utf-8")
+            cache.put(text, decoded_replacement)
+            return decoded_replacement
         return None
 
     def delete(self, replacement: str, thread_id: UUID) -> None:
-        # Check if the replacement exists
-        if not self.exists(replacement, thread_id):
-            raise ValueError(f"Replacement '{replacement}' not found in context {thread_id}")
-
-        # Get the original text to remove from the reverse index
-        data: str | None = self.client.get(self._replacement_key(thread_id, replacement))  # type: ignore
+        self._flush_context(thread_id)
+        # Remove the replacement and its reverse lookup atomically in a single script call
+        data: bytes | None = self._delete_script(
+            keys=[self._replacements_key(thread_id), self._text_to_replacement_key(thread_id), ENTRIES_COUNTER_KEY], args=[replacement]
+        )  # type: ignore
+        # A missing value means the replacement does not exist
         if data is None:
             raise ValueError(f"Replacement '{replacement}' not found in context {thread_id}")
-        # Parse the JSON to get the original text
-        original_text: str | None = json.loads(data)["text"] if data else None
-
-        # Use a pipeline for atomic operations
-        with self.client.pipeline() as pipe:
-            # Delete the replacement data
-            pipe.delete(self._replacement_key(thread_id, replacement))
-            # Remove the replacement from the set of replacements for this context
-            pipe.srem(self._replacements_set_key(thread_id), replacement)
-            # Remove from the reverse lookup index if we found the original text
-            if original_text:
-                pipe.hdel(self._text_to_replacement_key(thread_id), original_text)
-            # Execute all commands
-            pipe.execute()
+
+        # Unpack the data to get the original text
+        original_text: str = _decode_entity(data)[0]
+        cache: LRUCache[str, str] | None = self._replacement_cache.get(thread_id)
+        if cache is not None:
+            cache.pop(original_text)
 
     def clear(self, thread_id: UUID | None = None) -> None:
         if thread_id is not None:
+            # Make sure no pending write recreates the data after it was cleared
+            self._flush_context(thread_id)
             # Clear only the specified context
-            replacements: list[str] = self.list_replacements(thread_id)
-            if replacements:
-                # Use a pipeline for efficient deletion
-                with self.client.pipeline() as pipe:
-                    # Delete each replacement in this context
-                    for replacement in replacements:
-                        pipe.delete(self._replacement_key(thread_id, replacement))
-
-                    # Delete the set of replacements for this context
-                    pipe.delete(self._replacements_set_key(thread_id))
-                    # Delete the text-to-replacement mapping
-                    pipe.delete(self._text_to_replacement_key(thread_id))
-                    # Remove this context from the set of all contexts
-                    pipe.srem("ctxs", str(thread_id))
-                    # Execute all commands
-                    pipe.execute()
+            self._replacement_cache.pop(thread_id)
+            self._known_contexts.pop(thread_id)
+            # Remove the entries and uncount them atomically, so the entries counter cannot drift from concurrent writes
+            self._clear_script(keys=self._put_script_keys(thread_id), args=[uuid_str(thread_id)])
+            # Unlink the label counters of this context, which are not counted
+            self._unlink_matching(self._context_prefix(thread_id) + b"lc:*")
         else:
-            # Clear all data - get all contexts first
-            contexts_data: set[bytes] | None = self.client.smembers("ctxs")  # type: ignore
-            if contexts_data:
-                contexts: list[UUID] = [UUID(c.decode("utf-8")) for c in contexts_data]
-
-                # Use a pipeline for efficient deletion
-                with self.client.pipeline() as pipe:
-                    # For each context, delete its data
-                    for ctx in contexts:
-                        replacements = self.list_replacements(ctx)
-                        for replacement in replacements:
-                            pipe.delete(self._replacement_key(ctx, replacement))
-                        pipe.delete(self._replacements_set_key(ctx))
-                        pipe.delete(self._text_to_replacement_key(ctx))
-
-                    # Delete the set of all contexts
-                    pipe.delete("ctxs")
-                    # Execute all commands
-                    pipe.execute()
+            self.flush()
+            self._replacement_cache.clear()
+            self._known_contexts.clear()
+
+            # Unlink all keys of all contexts, the set of all contexts and the entries counter
+            self._unlink_matching(b"ctx:*")
+            self.client.unlink("ctxs", ENTRIES_COUNTER_KEY)
+
+    def _unlink_matching(self, match: bytes) -> None:
+        """
+        Unlink all keys matching the pattern, streamed with a cursor-based SCAN and unlinked in batches of SCAN_BATCH_SIZE.
+
+        Keys are removed with UNLINK, so Valkey frees their memory in a background thread instead of blocking on large hashes.
+        """
+        keys: list[bytes] = []
+        for key in self.client.scan_iter(match=match, count=SCAN_BATCH_SIZE):
+            keys.append(key)  # type: ignore
+            if len(keys) >= SCAN_BATCH_SIZE:
+                self.client.unlink(*keys)
+                keys = []
+
+        if keys:
+            self.client.unlink(*keys)
 
     def exists(self, replacement: str, thread_id: UUID) -> bool:
-        return bool(self.client.exists(self._replacement_key(thread_id, replacement)))
+        self._flush_context(thread_id)
+        return bool(self.client.hexists(self._replacements_key(thread_id), replacement))
 
     def list_replacements(self, thread_id: UUID) -> list[str]:
-        replacements: set[bytes] | None = self.client.smembers(self._replacements_set_key(thread_id))  # type: ignore
+        self._flush_context(thread_id)
+        replacements: list[bytes] | None = self.client.hkeys(self._replacements_key(thread_id))  # type: ignore
         # Convert from bytes to string
         return [r.decode("utf-8") for r in replacements] if replacements else []
 
-    def get_all_context_data(self, thread_id: UUID) -> dict[str, tuple[str, str]]:
-        result: dict[str, tuple[str, str]] = {}
-        replacements: list[str] = self.list_replacements(thread_id)
-
-        if replacements:
-            # Use a pipeline for batch retrieval
-            with self.client.pipeline() as pipe:
-                for replacement in replacements:
-                    pipe.get(self._replacement_key(thread_id, replacement))
+    def list_replacements_iter(self, thread_id: UUID, batch_size: int = SCAN_BATCH_SIZE) -> Iterator[str]:
+        """
+        Streams all replacements for a specific context, without blocking Valkey on very large contexts like HKEYS does.
 
-                values: list[str | None] = pipe.execute()
+        Args:
+            thread_id (UUID): UUID that identifies the specific context.
+            batch_size (int): Number of replacements requested from Valkey per HSCAN call.
 
-            for i, replacement in enumerate(replacements):
-                if values[i] is not None:
-                    data: dict[str, str] = json.loads(values[i])  # type: ignore
-                    result[replacement] = (data["text"], data["label"])
+        Returns:
+            Iterator[str]: Iterator of all replacements for the context.
+        """
+        self._flush_context(thread_id)
+        # NOVALUES skips transferring the packed data, as only the replacements are needed
+        for replacement in self.client.hscan_iter(self._replacements_key(thread_id), count=batch_size, no_values=True):
+            yield replacement.decode("utf-8")  # type: ignore
 
-        return result
+    def get_all_context_data(self, thread_id: UUID) -> dict[str, tuple[str, str]]:
+        self._flush_context(thread_id)
+        # Fetch all replacements of the context with a single HGETALL
+        data: dict[bytes, bytes] = self.client.hgetall(self._replacements_key(thread_id))  # type: ignore
+        return {replacement.decode("utf-8"): _decode_entity(value) for replacement, value in data.items()}
 
     def get_stats(self) -> dict[str, int]:
+        self.flush()
         stats: dict[str, int] = {}
 
-        # Get count of contexts
-        contexts_data: set[bytes] | None = self.client.smembers("ctxs")  # type: ignore
-        num_contexts: int = len(contexts_data) if contexts_data is not None else 0
+        # Get count of contexts and entries across all contexts in a single round trip, regardless of the dataset size
+        with self.client.pipeline(transaction=False) as pipe:
+            pipe.scard("ctxs")
+            pipe.get(ENTRIES_COUNTER_KEY)
+            num_contexts, total_entries = pipe.execute()
+
         stats["contexts"] = num_contexts
+        stats["total_entries"] = int(total_entries or 0)
+        stats["cache_size"] = sum(len(cache) for cache in self._replacement_cache.values())
+        return stats
 
-        # Get count of entries across all contexts
-        total_entries: int = 0
-        if contexts_data is not None:
-            for thread_id_bytes in contexts_data:
-                thread_id = UUID(thread_id_bytes.decode("utf-8"))
-                replacements: list[str] = self.list_replacements(thread_id)
-                total_entries += len(replacements)
+    def iterate_entries(self, thread_id: UUID | None = None, batch_size: int = SCAN_BATCH_SIZE) -> Iterator[tuple[str, str, str, UUID]]:
+        """
+        Iterates through all entries in the storage.
 
-        stats["total_entries"] = total_entries
-        return stats
+        Args:
+            thread_id (Optional[UUID]): If provided, only iterate through entries for this context.
+            batch_size (int): Number of elements requested from Valkey per cursor call, bounding memory per round trip.
 
-    def iterate_entries(self, thread_id: UUID | None = None) -> Iterator[tuple[str, str, str, UUID]]:
+        Returns:
+            Iterator[Tuple[str, str, str, UUID]]: iterator of (text, label, replacement, thread_id) tuples.
+        """
         if thread_id is not None:
-            # Iterate through entries for a specific context
-            replacements: list[str] = self.list_replacements(thread_id)
-            for replacement in replacements:
-                try:
-                    text: str
-                    label: str
-                    text, label = self.get_text(replacement, thread_id)
-                    yield (text, label, replacement, thread_id)
-                except ValueError:
-                    # Skip if entry was deleted during iteration
-                    continue
-        else:
-            # Iterate through entries for all contexts
-            contexts_data: set[bytes] | None = self.client.smembers("contexts")  # type: ignore
-            if contexts_data is not None:
-                for thread_id_bytes in contexts_data:
-                    ctx_id = UUID(thread_id_bytes.decode("utf-8"))
-                    yield from self.iterate_entries(ctx_id)
+            self._flush_context(thread_id)
+            yield from self._iterate_context(thread_id, batch_size)
+            return
 
-    def close(self) -> None:
-        self.client.close()
+        self.flush()
+        # Stream the contexts with a cursor-based SSCAN and each of their replacements with HSCAN
+        for ctx in self.client.sscan_iter("ctxs", count=batch_size):
+            yield from self._iterate_context(UUID(ctx.decode("utf-8")), batch_size)  # type: ignore
 
-    def __del__(self):
-        self.close()
+    def _iterate_context(self, thread_id: UUID, batch_size: int) -> Iterator[tuple[str, str, str, UUID]]:
+        """Stream the entries of a context with a cursor-based HSCAN instead of loading the whole hash"""
+        for replacement, value in self.client.hscan_iter(self._replacements_key(thread_id), count=batch_size):
+            text, label = _decode_entity(value)  # type: ignore
+            yield (text, label, replacement.decode("utf-8"), thread_id)  # type: ignore
+
+    def close(self) -> None:
+        try:
+            if self._finalizer.alive:
+                self.flush()
+        finally:
+            # Release the writer and the connections even if a pending write failed, so close() stays safe to call again
+            self._finalizer()
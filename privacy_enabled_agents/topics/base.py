@@ -1,5 +1,6 @@
+import random
 from abc import ABC, abstractmethod
-from typing import Any, TypedDict
+from typing import Any, ClassVar, TypedDict
 
 from langchain_core.language_models import BaseChatModel
 from langchain_core.runnables import RunnableConfig
@@ -33,7 +34,26 @@ class EvalTask(TypedDict):
 
 
 class EvalTaskCreator(ABC):
+    # Random generator all task randomness is drawn from, so a batch of tasks can be reproduced by seeding it
+    rng: ClassVar[random.Random] = random.Random()
+
     @classmethod
     @abstractmethod
     def create_eval_task(cls) -> EvalTask:
         pass
+
+    @classmethod
+    def create_eval_tasks(cls, n: int, seed: int | None = None) -> list[EvalTask]:
+        """
+        Create a batch of eval tasks up front.
+
+        Args:
+            n (int): Number of tasks to create.
+            seed (int | None): Seed for the random generator of the creator, to reproduce the same tasks. Defaults to None.
+
+        Returns:
+            list[EvalTask]: The created tasks.
+        """
+        if seed is not None:
+            cls.rng.seed(seed)
+        return [cls.create_eval_task() for _ in range(n)]
@@ -13,6 +13,9 @@ You are a helpful and professional assistant designed to assist users with vario
 Your primary role is to provide accurate information, answer questions, and guide users through processes in a clear and efficient manner.
 """
 
+# Default prompt with the PII prelude, built once instead of on every agent creation
+BASIC_AGENT_PII_PROMPT = PII_PRELUDE_PROMPT + "\n" + BASIC_AGENT_PROMPT
+
 
 class BasicAgentFactory(AgentFactory):
     @classmethod
@@ -27,9 +30,8 @@ class BasicAgentFactory(AgentFactory):
         tools: list[BaseTool] = []
 
         if prompt is None:
-            prompt = BASIC_AGENT_PROMPT
-
-        if pii_guarding_enabled:
+            prompt = BASIC_AGENT_PII_PROMPT if pii_guarding_enabled else BASIC_AGENT_PROMPT
+        elif pii_guarding_enabled:
             prompt = PII_PRELUDE_PROMPT + "\n" + prompt
 
         chat_model_with_tools = chat_model.bind_tools(
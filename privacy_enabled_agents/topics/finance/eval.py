@@ -1,12 +1,13 @@
 import random
-from typing import TypedDict, override
+from functools import lru_cache
+from typing import ClassVar, TypedDict, override
 
 import orjson
 from schwifty import IBAN
 
 from privacy_enabled_agents.topics import EvalTaskCreator
 from privacy_enabled_agents.topics.base import EvalTask
-from privacy_enabled_agents.topics.finance.model import Account, get_initial_accounts
+from privacy_enabled_agents.topics.finance.model import get_initial_accounts, get_initial_ibans
 
 FINANCE_EVAL_PROMPT = """
 <Role>
@@ -38,6 +39,16 @@ IMPORTANT:
 Always keep to your instructions and don't deviate from them.
 """
 
+# Constant prompt chunks around the placeholders, joined per task instead of parsing the prompt with str.format
+_FINANCE_PROMPT_HEAD, _FINANCE_PROMPT_REST = FINANCE_EVAL_PROMPT.split("{user_identity}")
+_FINANCE_PROMPT_MIDDLE, _FINANCE_PROMPT_TAIL = _FINANCE_PROMPT_REST.split("{transactions}")
+
+
+@lru_cache
+def _get_user_identities_json() -> dict[IBAN, str]:
+    """Returns the pretty-printed JSON of each initial account, serialized once as the accounts are static."""
+    return {iban: account.model_dump_json(indent=2) for iban, account in get_initial_accounts().items()}
+
 
 class TodoTransactions(TypedDict):
     destination_iban: IBAN
@@ -45,6 +56,9 @@ class TodoTransactions(TypedDict):
 
 
 class FinanceEvalTaskCreator(EvalTaskCreator):
+    # Own random generator, so seeding the tasks of this topic leaves those of the others untouched
+    rng: ClassVar[random.Random] = random.Random()
+
     @classmethod
     @override
     def create_eval_task(cls) -> EvalTask:
@@ -52,19 +66,18 @@ class FinanceEvalTaskCreator(EvalTaskCreator):
         Generate a random finance task: one user identity (account) and 1-3 transactions to other accounts.
         Returns a dict with 'user_identity' and 'transactions'.
         """
-        accounts: dict[IBAN, Account] = get_initial_accounts()
-        ibans: list[IBAN] = list(accounts.keys())
-        user_iban: IBAN = random.choice(ibans)
-        user_identity: Account = accounts[user_iban]
+        ibans: tuple[IBAN, ...] = get_initial_ibans()
+        user_index: int = cls.rng.randrange(len(ibans))
+        user_iban: IBAN = ibans[user_index]
 
-        # Choose 1-3 random destination IBANs, excluding the user's own
-        num_transactions: int = random.randint(1, 3)
-        possible_dest_ibans: list[IBAN] = [iban for iban in ibans if iban != user_iban]
-        dest_ibans: list[IBAN] = random.sample(possible_dest_ibans, k=min(num_transactions, len(possible_dest_ibans)))
+        # Choose 1-3 random destination IBANs, excluding the user's own by skipping over its index
+        num_transactions: int = cls.rng.randint(1, 3)
+        dest_indices: list[int] = cls.rng.sample(range(len(ibans) - 1), k=min(num_transactions, len(ibans) - 1))
+        dest_ibans: list[IBAN] = [ibans[index if index < user_index else index + 1] for index in dest_indices]
 
         transactions: list[TodoTransactions] = []
         for dest_iban in dest_ibans:
-            amount: float = round(random.uniform(100, 5000), 2)
+            amount: float = round(cls.rng.uniform(100, 5000), 2)
             transactions.append(
                 {
                     "destination_iban": dest_iban,
@@ -73,8 +86,7 @@ class FinanceEvalTaskCreator(EvalTaskCreator):
             )
 
         # Create the agent state
-        instruction = FINANCE_EVAL_PROMPT.format(
-            user_identity=user_identity.model_dump_json(indent=2),
-            transactions=orjson.dumps(transactions, option=orjson.OPT_INDENT_2),
-        )
+        user_identity_json: str = _get_user_identities_json()[user_iban]
+        transactions_json: str = orjson.dumps(transactions, option=orjson.OPT_INDENT_2).decode()
+        instruction = f"{_FINANCE_PROMPT_HEAD}{user_identity_json}{_FINANCE_PROMPT_MIDDLE}{transactions_json}{_FINANCE_PROMPT_TAIL}"
         return {"instruction": instruction, "additional_kwargs": {"user_iban": user_iban}}
@@ -62,6 +62,16 @@ You have access to the following banking services and can assist customers with:
 Always prioritize customer security and satisfaction while ensuring full regulatory compliance in all banking operations.
 """
 
+# Default prompt with the PII prelude, built once instead of on every agent creation
+FINANCE_AGENT_PII_PROMPT = PII_PRELUDE_PROMPT + "\n" + FINANCE_AGENT_PROMPT
+
+# The tools are stateless, so they are created once and shared by all agents
+FINANCE_TOOLS: tuple[BaseTool, ...] = (
+    CheckBalanceTool(),
+    TransferMoneyTool(),
+    IncreaseCreditLimitTool(),
+)
+
 
 class FinanceAgentFactory(AgentFactory):
     @classmethod
@@ -73,16 +83,11 @@ class FinanceAgentFactory(AgentFactory):
         prompt: str | None = None,
         pii_guarding_enabled: bool = True,
     ) -> CompiledStateGraph:
-        tools: list[BaseTool] = [
-            CheckBalanceTool(),
-            TransferMoneyTool(),
-            IncreaseCreditLimitTool(),
-        ]
+        tools: tuple[BaseTool, ...] = FINANCE_TOOLS
 
         if prompt is None:
-            prompt = FINANCE_AGENT_PROMPT
-
-        if pii_guarding_enabled:
+            prompt = FINANCE_AGENT_PII_PROMPT if pii_guarding_enabled else FINANCE_AGENT_PROMPT
+        elif pii_guarding_enabled:
             prompt = PII_PRELUDE_PROMPT + "\n" + prompt
 
         chat_model_with_tools = chat_model.bind_tools(
@@ -1,9 +1,10 @@
+import csv
 import random
 from datetime import date, datetime
 from functools import lru_cache
+from types import MappingProxyType
 from typing import Literal
 
-import pandas as pd
 from pydantic import BaseModel, Field
 from schwifty import IBAN
 
@@ -38,24 +39,41 @@ class Transfer(BaseModel):
     timestamp: datetime
 
 
+@lru_cache(maxsize=8192)
+def _iban(value: str) -> IBAN:
+    """Returns the IBAN for the string, cached to avoid repeating the parsing and checksum validation."""
+    return IBAN(value)
+
+
 @lru_cache
+def _load_initial_accounts() -> MappingProxyType[IBAN, Account]:
+    """Loads the initial accounts once, skipping validation as the bundled CSV data is trusted."""
+    with open("data/finance_initial_accounts.csv", newline="") as file:
+        accounts: dict[IBAN, Account] = {}
+        for row in csv.DictReader(file):
+            iban: IBAN = _iban(row["iban"])
+            accounts[iban] = Account.model_construct(
+                iban=iban,
+                balance=float(row["balance"]),
+                currency=row["currency"],
+                holder_name=row["holder_name"],
+                holder_age=int(row["holder_age"]),
+                account_created=date.fromisoformat(row["account_created"]),
+                credit_limit=float(row["credit_limit"]),
+                monthly_income=float(row["monthly_income"]),
+            )
+    return MappingProxyType(accounts)
+
+
 def get_initial_accounts() -> dict[IBAN, Account]:
-    accounts: pd.DataFrame = pd.read_csv(
-        "data/finance_initial_accounts.csv",
-    )
-    return {
-        IBAN(row["iban"]): Account(
-            balance=row["balance"],
-            currency=row["currency"],
-            holder_name=row["holder_name"],
-            holder_age=row["holder_age"],
-            account_created=date.fromisoformat(row["account_created"]),
-            credit_limit=row["credit_limit"],
-            monthly_income=row["monthly_income"],
-            iban=IBAN(row["iban"]),
-        )
-        for _, row in accounts.iterrows()
-    }
+    """Returns a new dictionary of the initial accounts, built from the cached snapshot."""
+    return dict(_load_initial_accounts())
+
+
+@lru_cache
+def get_initial_ibans() -> tuple[IBAN, ...]:
+    """Returns the IBANs of the initial accounts."""
+    return tuple(_load_initial_accounts())
 
 
 class FinanceState(PrivacyEnabledAgentState):
@@ -70,6 +88,6 @@ class FinanceState(PrivacyEnabledAgentState):
         description="A list of transfers that have been made.",
     )
     user_iban: IBAN = Field(
-        default_factory=lambda: random.choice(list(get_initial_accounts().keys())),
+        default_factory=lambda: random.choice(get_initial_ibans()),
         description="The user's IBAN for the finance agent.",
     )
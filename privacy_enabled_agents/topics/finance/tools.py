@@ -1,4 +1,6 @@
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
+from functools import lru_cache
+from time import monotonic
 from typing import Annotated, Literal
 
 from langchain_core.messages import ToolMessage
@@ -11,6 +13,12 @@ from schwifty import IBAN
 from .model import Account, FinanceState, Transfer
 
 
+@lru_cache(maxsize=1)
+def _today(minute: int) -> date:
+    """Returns today's date, cached for the given minute of the monotonic clock."""
+    return date.today()
+
+
 class CheckBalanceInput(BaseModel):
     """Input schema for the check_balance tool."""
 
@@ -74,13 +82,16 @@ class TransferMoneyTool(BaseTool):
         if source_account.balance + source_account.credit_limit < amount:
             raise ValueError(f"Insufficient funds / credit in source account {state.user_iban}.")
 
-        # Update balances
-        source_account.balance -= amount
-        destination_account.balance += amount
+        # Update balances on copies, as the account instances are shared with the initial accounts snapshot
+        source_account = source_account.model_copy(update={"balance": source_account.balance - amount})
+        # A transfer to the own account has to net to zero, so it is credited to the already debited copy
+        if destination_iban == state.user_iban:
+            destination_account = source_account
+        destination_account = destination_account.model_copy(update={"balance": destination_account.balance + amount})
 
-        # Log the transfer
+        # Log the transfer, skipping validation as all values are already validated
         state.transfers.append(
-            Transfer(
+            Transfer.model_construct(
                 source_iban=state.user_iban,
                 destination_iban=destination_iban,
                 amount=amount,
@@ -139,7 +150,7 @@ class IncreaseCreditLimitTool(BaseTool):
             raise ValueError(f"Account {iban} not found.")
 
         # The account must be at least 30 days old to increase credit limit
-        if account.account_created > datetime.now() - timedelta(days=30):
+        if account.account_created > _today(int(monotonic() // 60)) - timedelta(days=30):
             raise ValueError(f"Account {iban} must be at least 30 days old to increase credit limit.")
 
         # The new credit limit must not exceed 10,000
@@ -155,7 +166,7 @@ class IncreaseCreditLimitTool(BaseTool):
             raise ValueError(f"Insufficient income to increase credit limit for account {iban}.")
 
         # If all checks pass, increase the credit limit
-        account.credit_limit += amount
+        account = account.model_copy(update={"credit_limit": account.credit_limit + amount})
         state.accounts[iban] = account
 
         return Command(
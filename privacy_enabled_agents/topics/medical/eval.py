@@ -1,9 +1,11 @@
 import csv
 import random
 from datetime import date, datetime, timedelta
-from json import dumps
+from functools import lru_cache
 from pathlib import Path
-from typing import TypedDict, override
+from typing import ClassVar, TypedDict, override
+
+import orjson
 
 from privacy_enabled_agents.custom_types.german_medical_insurance_id import GermanMedicalInsuranceID
 from privacy_enabled_agents.topics import EvalTaskCreator
@@ -40,6 +42,10 @@ Always keep to your instructions and don't deviate from them.
 Act professionally and courteously as you would with real medical services.
 """
 
+# Constant prompt chunks around the placeholders, joined per task instead of parsing the prompt with str.format
+_MEDICAL_PROMPT_HEAD, _MEDICAL_PROMPT_REST = MEDICAL_EVAL_PROMPT.split("{patient_identity}")
+_MEDICAL_PROMPT_MIDDLE, _MEDICAL_PROMPT_TAIL = _MEDICAL_PROMPT_REST.split("{transport_tasks}")
+
 
 class PatientIdentity(TypedDict):
     name: str
@@ -77,8 +83,11 @@ def load_sample_patients() -> list[PatientIdentity]:
     return patients
 
 
-# Sample patient identities loaded from CSV
-SAMPLE_PATIENTS: list[PatientIdentity] = load_sample_patients()
+@lru_cache
+def get_sample_patients() -> tuple[tuple[PatientIdentity, str], ...]:
+    """Sample patient identities loaded from CSV on first use, each paired with its pretty-printed JSON."""
+    return tuple((patient, orjson.dumps(patient, option=orjson.OPT_INDENT_2).decode()) for patient in load_sample_patients())
+
 
 # Sample medical facilities and transport scenarios
 MEDICAL_FACILITIES = [
@@ -108,6 +117,9 @@ TRANSPORT_SCENARIOS = [
 
 
 class MedicalEvalTaskCreator(EvalTaskCreator):
+    # Own random generator, so seeding the tasks of this topic leaves those of the others untouched
+    rng: ClassVar[random.Random] = random.Random()
+
     @classmethod
     @override
     def create_eval_task(cls) -> EvalTask:
@@ -116,16 +128,18 @@ class MedicalEvalTaskCreator(EvalTaskCreator):
         Returns a dict with 'patient_identity' and 'transport_tasks'.
         """
         # Choose a random patient
-        patient: PatientIdentity = random.choice(SAMPLE_PATIENTS)
+        patient: PatientIdentity
+        patient_identity_json: str
+        patient, patient_identity_json = cls.rng.choice(get_sample_patients())
 
         # Generate 1 transport task
-        scenario = random.choice(TRANSPORT_SCENARIOS)
-        facility = random.choice(MEDICAL_FACILITIES)
+        scenario = cls.rng.choice(TRANSPORT_SCENARIOS)
+        facility = cls.rng.choice(MEDICAL_FACILITIES)
 
         # Generate a random future datetime (next 1-30 days)
-        days_ahead = random.randint(1, 30)
-        hours = random.randint(8, 17)  # Business hours
-        minutes = random.choice([0, 15, 30, 45])  # Quarter hour intervals
+        days_ahead = cls.rng.randint(1, 30)
+        hours = cls.rng.randint(8, 17)  # Business hours
+        minutes = cls.rng.choice([0, 15, 30, 45])  # Quarter hour intervals
 
         transport_datetime = datetime.now().replace(hour=hours, minute=minutes, second=0, microsecond=0) + timedelta(days=days_ahead)
 
@@ -140,27 +154,8 @@ class MedicalEvalTaskCreator(EvalTaskCreator):
         transport_tasks = [transport_task]
 
         # Create the agent instruction
-        instruction = MEDICAL_EVAL_PROMPT.format(
-            patient_identity=dumps(
-                {
-                    "name": patient["name"],
-                    "date_of_birth": patient["date_of_birth"].isoformat(),
-                    "medical_insurance_id": str(patient["medical_insurance_id"]),
-                    "current_address": patient["current_address"],
-                },
-                indent=2,
-            ),
-            transport_tasks=dumps(
-                [
-                    {
-                        **task,
-                        "transport_datetime": task["transport_datetime"].isoformat(),
-                    }
-                    for task in transport_tasks
-                ],
-                indent=2,
-            ),
-        )
+        transport_tasks_json: str = orjson.dumps(transport_tasks, option=orjson.OPT_INDENT_2).decode()
+        instruction = f"{_MEDICAL_PROMPT_HEAD}{patient_identity_json}{_MEDICAL_PROMPT_MIDDLE}{transport_tasks_json}{_MEDICAL_PROMPT_TAIL}"
 
         return {
             "instruction": instruction,
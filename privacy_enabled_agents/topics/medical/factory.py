@@ -62,6 +62,19 @@ Your primary role is to help patients and healthcare professionals coordinate me
 You should provide accurate, helpful, and timely responses while maintaining the highest standards of medical confidentiality and service quality.
 """
 
+# Default prompt with the PII prelude, built once instead of on every agent creation
+MEDICAL_AGENT_PII_PROMPT = PII_PRELUDE_PROMPT + "\n" + MEDICAL_AGENT_PROMPT
+
+# The tools are stateless, so they are created once and shared by all agents
+MEDICAL_TOOLS: tuple[BaseTool, ...] = (
+    GetCoordinateFromAdressTool(),
+    CheckServiceAreaTool(),
+    FindNearbyMedicalFacilitiesTool(),
+    BookMedicalTransportTool(),
+    ListMedicalTransportsTool(),
+    CancelMedicalTransportTool(),
+)
+
 
 class MedicalAgentFactory(AgentFactory):
     @classmethod
@@ -73,19 +86,11 @@ class MedicalAgentFactory(AgentFactory):
         prompt: str | None = None,
         pii_guarding_enabled: bool = True,
     ) -> CompiledStateGraph:
-        tools: list[BaseTool] = [
-            GetCoordinateFromAdressTool(),
-            CheckServiceAreaTool(),
-            FindNearbyMedicalFacilitiesTool(),
-            BookMedicalTransportTool(),
-            ListMedicalTransportsTool(),
-            CancelMedicalTransportTool(),
-        ]
+        tools: tuple[BaseTool, ...] = MEDICAL_TOOLS
 
         if prompt is None:
-            prompt = MEDICAL_AGENT_PROMPT
-
-        if pii_guarding_enabled:
+            prompt = MEDICAL_AGENT_PII_PROMPT if pii_guarding_enabled else MEDICAL_AGENT_PROMPT
+        elif pii_guarding_enabled:
             prompt = PII_PRELUDE_PROMPT + "\n" + prompt
 
         chat_model_with_tools = chat_model.bind_tools(
@@ -92,9 +92,9 @@ class MedicalState(PrivacyEnabledAgentState):
         default_factory=create_medical_facilities,
         description="List of medical facilities in the service area.",
     )
-    transports: list[MedicalTransport] = Field(
-        default_factory=list,
-        description="List of medical transport requests made by the user.",
+    transports: dict[str, MedicalTransport] = Field(
+        default_factory=dict,
+        description="A dictionary of medical transport requests made by the user indexed by their transport IDs.",
     )
     transport_id_counter: int = Field(
         default=1,
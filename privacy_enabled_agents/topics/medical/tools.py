@@ -1,12 +1,9 @@
-from collections.abc import Generator
 from datetime import date, datetime
 from functools import lru_cache
-from random import randint
-from typing import Annotated, Any, Literal
+from math import asin, cos, radians, sin, sqrt
+from secrets import randbelow
+from typing import TYPE_CHECKING, Annotated, Any, Literal
 
-from geopy import Location
-from geopy.distance import distance
-from geopy.geocoders import Nominatim
 from langchain_core.messages import ToolMessage
 from langchain_core.tools import ArgsSchema, BaseTool, InjectedToolCallId
 from langgraph.prebuilt import InjectedState
@@ -25,6 +22,15 @@ from .model import (
     MedicalTransport,
 )
 
+if TYPE_CHECKING:
+    from geopy import Location
+    from geopy.geocoders import Nominatim
+
+# Radius in kilometers within which medical facilities count as nearby
+NEARBY_RADIUS_KM: float = 10
+# Mean earth radius in kilometers, used for the haversine distance
+EARTH_RADIUS_KM: float = 6371.0088
+
 GermanPhoneNumber = Annotated[
     str | PhoneNumber,
     PhoneNumberValidator(supported_regions=["DE"], default_region="DE"),
@@ -32,10 +38,41 @@ GermanPhoneNumber = Annotated[
 
 
 @lru_cache
-def get_nominatim_geocoder() -> Nominatim:
+def get_nominatim_geocoder() -> "Nominatim":
+    # Imported on first use, as geopy is only needed once a geocoding tool is actually called
+    from geopy.geocoders import Nominatim
+
     return Nominatim(user_agent="privacy_enabled_agents")
 
 
+def _haversine_km(latitude: float, longitude: float, other_latitude: float, other_longitude: float) -> float:
+    """Great-circle distance in kilometers, accurate to well below a percent at city scale and much cheaper than a geodesic."""
+    latitude, longitude, other_latitude, other_longitude = map(radians, (latitude, longitude, other_latitude, other_longitude))
+    a: float = sin((other_latitude - latitude) / 2) ** 2 + cos(latitude) * cos(other_latitude) * sin((other_longitude - longitude) / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * asin(sqrt(a))
+
+
+@lru_cache(maxsize=8192)
+def _geocode(normalized_address: str) -> tuple[float, float]:
+    """Geocodes a normalized address, cached as the same addresses recur across conversations.
+
+    Misses raise instead of returning None, as exceptions are not cached and a transient failure must not stick.
+    """
+    location: Location | None = get_nominatim_geocoder().geocode(normalized_address)  # type: ignore
+    if location:
+        return location.latitude, location.longitude
+    raise ValueError("Could not find coordinates for address.")
+
+
+@lru_cache(maxsize=8192)
+def _reverse_geocode(latitude: float, longitude: float) -> str:
+    """Looks up the address for coordinates, cached like _geocode; callers round them to roughly 100 m so nearby points share an entry."""
+    location: Location | None = get_nominatim_geocoder().reverse(query=(latitude, longitude), exactly_one=True)  # type: ignore
+    if location:
+        return location.address
+    raise ValueError("Could not find location for coordinates.")
+
+
 class GetCoordinateFromAddressInput(BaseModel):
     """Input schema for the get_coordinate_from_address tool."""
 
@@ -52,11 +89,7 @@ class GetCoordinateFromAdressTool(BaseTool):
     response_format: Literal["content", "content_and_artifact"] = "content"
 
     def _run(self, address: str) -> tuple[float, float]:
-        geocoder: Nominatim = get_nominatim_geocoder()
-        location: Location | None = geocoder.geocode(address)  # type: ignore
-        if location:
-            return location.latitude, location.longitude
-        raise ValueError("Could not find coordinates for address.")
+        return _geocode(" ".join(address.lower().split()))
 
 
 class CheckServiceAreaInput(BaseModel):
@@ -76,16 +109,10 @@ class CheckServiceAreaTool(BaseTool):
     response_format: Literal["content", "content_and_artifact"] = "content"
 
     def _run(self, latitude: float, longitude: float) -> bool:
-        geocoder: Nominatim = get_nominatim_geocoder()
         context: MedicalContext = get_runtime(MedicalContext).context
 
-        loc: Location | None = geocoder.reverse(
-            query=(latitude, longitude),
-            exactly_one=True,
-        )  # type: ignore
-        if loc:
-            return context.city in loc.address
-        raise ValueError("Could not find location for coordinates.")
+        address: str = _reverse_geocode(round(latitude, 3), round(longitude, 3))
+        return context.city in address
 
 
 class FindNearbyMedicalFacilitiesInput(BaseModel):
@@ -113,15 +140,11 @@ class FindNearbyMedicalFacilitiesTool(BaseTool):
         longitude: float,
         state: Annotated[MedicalState, InjectedState],
     ) -> list[MedicalFacility]:
-        facilities: list[MedicalFacility] = state.facilities
         nearby_facilities: list[MedicalFacility] = []
-        for facility in facilities:
-            facility_distance: float = distance(
-                (latitude, longitude),
-                (facility.location[0], facility.location[1]),
-            ).km
-            if facility_distance <= 10:
-                nearby_facilities.append(facility)
+        for facility in state.facilities:
+            facility_distance: float = _haversine_km(latitude, longitude, facility.location[0], facility.location[1])
+            if facility_distance <= NEARBY_RADIUS_KM:
+                nearby_facilities.append(facility.model_copy(update={"distance": facility_distance}))
         return sorted(
             nearby_facilities,
             key=lambda x: x.distance or float("inf"),
@@ -188,11 +211,12 @@ class BookMedicalTransportTool(BaseTool):
             start_location: tuple[float, float] = fac.location
             destination_location: tuple[float, float] = (latitude, longitude)
         # Create a new random transport PIN
-        transport_pin: str = f"{randint(0, 999999):06d}"
+        transport_pin: str = f"{randbelow(1_000_000):06d}"
         transport_id: str = f"TR{state.transport_id_counter:04d}"
         state.transport_id_counter += 1
 
-        transport = MedicalTransport(
+        # Skip validation, as the arguments were already validated by the args_schema and the rest is generated above
+        transport = MedicalTransport.model_construct(
             transport_id=transport_id,
             transport_pin=transport_pin,
             start_location=start_location,
@@ -203,13 +227,13 @@ class BookMedicalTransportTool(BaseTool):
             patient_medical_insurance_id=patient_medical_insurance_id,
         )
 
-        state.transports.append(transport)
+        state.transports[transport_id] = transport
         return Command(
             update={
                 "transports": state.transports,
                 "transport_id_counter": state.transport_id_counter,
                 "messages": [
-                    ToolMessage(
+                    ToolMessage.model_construct(
                         content=f"Medical transport booked successfully! Transport PIN: {transport_pin}",
                         tool_call_id=tool_call_id,
                         status="success",
@@ -243,11 +267,20 @@ class ListMedicalTransportsTool(BaseTool):
     def _run(
         self, patient_medical_insurance_id: GermanMedicalInsuranceID, patient_dob: date, state: Annotated[MedicalState, InjectedState]
     ) -> list[dict[str, Any]]:
-        transports: Generator = (
-            t for t in state.transports if t.patient_medical_insurance_id == patient_medical_insurance_id and t.patient_dob == patient_dob
-        )
-        transports = (t.model_dump().pop("transport_pin") for t in transports)
-        return list(transports)
+        # Project the fields directly instead of dumping each model, leaving out the secret transport PIN
+        return [
+            {
+                "transport_id": t.transport_id,
+                "start_location": t.start_location,
+                "destination_location": t.destination_location,
+                "transport_datetime": t.transport_datetime,
+                "patient_name": t.patient_name,
+                "patient_dob": t.patient_dob,
+                "patient_medical_insurance_id": t.patient_medical_insurance_id,
+            }
+            for t in state.transports.values()
+            if t.patient_medical_insurance_id == patient_medical_insurance_id and t.patient_dob == patient_dob
+        ]
 
 
 class CancelMedicalTransportInput(BaseModel):
@@ -281,19 +314,19 @@ class CancelMedicalTransportTool(BaseTool):
         state: Annotated[MedicalState, InjectedState],
         tool_call_id: Annotated[str, InjectedToolCallId],
     ) -> Command:
-        transport: MedicalTransport | None = next((t for t in state.transports if t.transport_id == transport_id), None)
+        transport: MedicalTransport | None = state.transports.get(transport_id)
         if not transport:
             raise ValueError(f"Transport with ID {transport_id} not found.")
 
         if transport.transport_pin != transport_pin:
             raise ValueError("Invalid transport PIN provided.")
 
-        state.transports.remove(transport)
+        del state.transports[transport_id]
         return Command(
             update={
                 "transports": state.transports,
                 "messages": [
-                    ToolMessage(
+                    ToolMessage.model_construct(
                         content="Medical transport canceled successfully.",
                         tool_call_id=tool_call_id,
                         status="success",
@@ -1,6 +1,8 @@
 import random
-from json import dumps
-from typing import Literal, TypedDict, override
+from functools import lru_cache
+from typing import ClassVar, Literal, TypedDict, override
+
+import orjson
 
 from privacy_enabled_agents.custom_types import GermanLicensePlate
 from privacy_enabled_agents.topics import EvalTaskCreator
@@ -38,6 +40,10 @@ Always keep to your instructions and don't deviate from them.
 Act professionally and courteously as you would with real city services.
 """
 
+# Constant prompt chunks around the placeholders, joined per task instead of parsing the prompt with str.format
+_PUBLIC_SERVICE_PROMPT_HEAD, _PUBLIC_SERVICE_PROMPT_REST = PUBLIC_SERVICE_EVAL_PROMPT.split("{citizen_identity}")
+_PUBLIC_SERVICE_PROMPT_MIDDLE, _PUBLIC_SERVICE_PROMPT_TAIL = _PUBLIC_SERVICE_PROMPT_REST.split("{permit_tasks}")
+
 
 class PermitTask(TypedDict):
     task_type: str
@@ -47,8 +53,27 @@ class PermitTask(TypedDict):
     description: str
 
 
-# Sample citizen identities loaded from CSV
-SAMPLE_CITIZENS: list[Citizen] = list(get_initial_citizens().values())
+@lru_cache
+def get_sample_citizens() -> tuple[tuple[Citizen, str], ...]:
+    """Sample citizen identities loaded from CSV on first use, each paired with its pretty-printed JSON."""
+    return tuple(
+        (
+            citizen,
+            orjson.dumps(
+                {
+                    "name": citizen["name"],
+                    "address": citizen["address"],
+                    "id_number": citizen["id_number"],
+                    "registration_date": citizen["registration_date"].isoformat(),
+                    "phone": citizen["phone"],
+                    "email": citizen["email"],
+                },
+                option=orjson.OPT_INDENT_2,
+            ).decode(),
+        )
+        for citizen in get_initial_citizens().values()
+    )
+
 
 # Sample parking zones and vehicle plates
 PARKING_ZONES = ["Altstadt", "Schwabing", "Bogenhausen", "Maxvorstadt"]
@@ -88,6 +113,9 @@ PERMIT_SECOND_SCENARIOS = [
 
 
 class PublicServiceEvalTaskCreator(EvalTaskCreator):
+    # Own random generator, so seeding the tasks of this topic leaves those of the others untouched
+    rng: ClassVar[random.Random] = random.Random()
+
     @classmethod
     @override
     def create_eval_task(cls) -> EvalTask:
@@ -96,12 +124,14 @@ class PublicServiceEvalTaskCreator(EvalTaskCreator):
         Returns a dict with 'citizen_identity' and 'permit_tasks'.
         """
         # Choose a random citizen
-        citizen: Citizen = random.choice(SAMPLE_CITIZENS)
-        zone = random.choice(PARKING_ZONES)
-        license_plate = GermanLicensePlate.random()
+        citizen: Citizen
+        citizen_identity_json: str
+        citizen, citizen_identity_json = cls.rng.choice(get_sample_citizens())
+        zone = cls.rng.choice(PARKING_ZONES)
+        license_plate = GermanLicensePlate.random(cls.rng)
 
-        first_scenario = random.choice(PERMIT_FIRST_SCENARIOS)
-        second_scenario = random.choice(PERMIT_SECOND_SCENARIOS)
+        first_scenario = cls.rng.choice(PERMIT_FIRST_SCENARIOS)
+        second_scenario = cls.rng.choice(PERMIT_SECOND_SCENARIOS)
 
         permit_tasks = []
 
@@ -124,19 +154,15 @@ class PublicServiceEvalTaskCreator(EvalTaskCreator):
         permit_tasks.append(second_task)
 
         # Create the agent instruction
-        instruction = PUBLIC_SERVICE_EVAL_PROMPT.format(
-            citizen_identity=dumps(
-                {
-                    "name": citizen["name"],
-                    "address": citizen["address"],
-                    "id_number": citizen["id_number"],
-                    "registration_date": citizen["registration_date"].isoformat(),
-                    "phone": citizen["phone"],
-                    "email": citizen["email"],
-                },
-                indent=2,
-            ),
-            permit_tasks=dumps(permit_tasks, indent=2),
+        permit_tasks_json: str = orjson.dumps(permit_tasks, option=orjson.OPT_INDENT_2).decode()
+        instruction = "".join(
+            (
+                _PUBLIC_SERVICE_PROMPT_HEAD,
+                citizen_identity_json,
+                _PUBLIC_SERVICE_PROMPT_MIDDLE,
+                permit_tasks_json,
+                _PUBLIC_SERVICE_PROMPT_TAIL,
+            )
         )
 
         return {
@@ -74,6 +74,17 @@ COMMUNICATION STYLE:
 Your goal is to make the parking permit process as smooth and transparent as possible while ensuring all city regulations are properly followed.
 """
 
+# Default prompt with the PII prelude, built once instead of on every agent creation
+PUBLIC_SERVICE_AGENT_PII_PROMPT = PII_PRELUDE_PROMPT + "\n" + PUBLIC_SERVICE_AGENT_PROMPT
+
+# The tools are stateless, so they are created once and shared by all agents
+PUBLIC_SERVICE_TOOLS: tuple[BaseTool, ...] = (
+    CheckParkingPermitsTool(),
+    ApplyParkingPermitTool(),
+    PayParkingPermitFeeTool(),
+    RenewParkingPermitTool(),
+)
+
 
 class PublicServiceAgentFactory(AgentFactory):
     @classmethod
@@ -85,17 +96,11 @@ class PublicServiceAgentFactory(AgentFactory):
         prompt: str | None = None,
         pii_guarding_enabled: bool = True,
     ) -> CompiledStateGraph:
-        tools: list[BaseTool] = [
-            CheckParkingPermitsTool(),
-            ApplyParkingPermitTool(),
-            PayParkingPermitFeeTool(),
-            RenewParkingPermitTool(),
-        ]
+        tools: tuple[BaseTool, ...] = PUBLIC_SERVICE_TOOLS
 
         if prompt is None:
-            prompt = PUBLIC_SERVICE_AGENT_PROMPT
-
-        if pii_guarding_enabled:
+            prompt = PUBLIC_SERVICE_AGENT_PII_PROMPT if pii_guarding_enabled else PUBLIC_SERVICE_AGENT_PROMPT
+        elif pii_guarding_enabled:
             prompt = PII_PRELUDE_PROMPT + "\n" + prompt
 
         chat_model_with_tools = chat_model.bind_tools(
@@ -1,8 +1,10 @@
+import operator
 import random
 from datetime import datetime
-from typing import Literal, TypedDict
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Annotated, Literal, TypedDict
 
-import pandas as pd
 from pydantic import Field
 
 from privacy_enabled_agents import PrivacyEnabledAgentState
@@ -37,20 +39,30 @@ class ParkingPermit(TypedDict):
     annual_fee: float
 
 
+@lru_cache
+def _load_initial_citizens() -> MappingProxyType[str, Citizen]:
+    """Load initial citizen data once."""
+    import pandas as pd
+
+    df = pd.read_csv(
+        "data/public_service_sample_citizens.csv",
+        dtype={"name": str, "address": str, "id_number": str, "phone": str, "email": str},
+        parse_dates=["registration_date"],
+    )
+    # The CSV columns are exactly the Citizen fields, so the records can be used as they are
+    citizens: list[Citizen] = df.to_dict(orient="records")  # type: ignore
+    return MappingProxyType({citizen["id_number"]: citizen for citizen in citizens})
+
+
 def get_initial_citizens() -> dict[str, Citizen]:
-    """Load initial citizen data."""
-    df = pd.read_csv("data/public_service_sample_citizens.csv")
-    return {
-        row["id_number"]: {
-            "name": row["name"],
-            "address": row["address"],
-            "id_number": row["id_number"],
-            "registration_date": pd.to_datetime(row["registration_date"]),
-            "phone": row["phone"],
-            "email": row["email"],
-        }
-        for _, row in df.iterrows()
-    }
+    """Returns a new dictionary of the initial citizens, built from the cached snapshot."""
+    return dict(_load_initial_citizens())
+
+
+@lru_cache
+def get_initial_citizen_ids() -> tuple[str, ...]:
+    """Returns the ID numbers of the initial citizens."""
+    return tuple(_load_initial_citizens())
 
 
 class PublicServiceState(PrivacyEnabledAgentState):
@@ -60,11 +72,16 @@ class PublicServiceState(PrivacyEnabledAgentState):
         default_factory=get_initial_citizens,
         description="A dictionary of citizens indexed by their city IDs.",
     )
-    parking_permits: dict[str, ParkingPermit] = Field(
+    # Merged with the updates of the tools, so they only need to return the permits they changed
+    parking_permits: Annotated[dict[str, ParkingPermit], operator.or_] = Field(
         default_factory=dict,
         description="A dictionary of parking permits indexed by permit IDs.",
     )
+    permit_id_counter: int = Field(
+        default=1,
+        description="Counter for generating unique permit IDs.",
+    )
     current_citizen_id: str = Field(
-        default_factory=lambda: random.choice(list(get_initial_citizens().values()))["id_number"],
+        default_factory=lambda: random.choice(get_initial_citizen_ids()),
         description="The current citizen's ID for the public service agent.",
     )
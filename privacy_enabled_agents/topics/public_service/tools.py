@@ -1,5 +1,6 @@
 from datetime import datetime, timedelta
-from random import random
+from random import Random
+from types import MappingProxyType
 from typing import Annotated, Literal
 
 from langchain_core.messages import ToolMessage
@@ -14,6 +15,26 @@ from .model import (
     PublicServiceState,
 )
 
+# Random generator of the simulated processing failures
+_rng: Random = Random()
+# Validity period of a parking permit
+PERMIT_VALIDITY: timedelta = timedelta(days=365)
+# Minimum period a citizen must be registered before applying for a permit
+MIN_REGISTRATION_PERIOD: timedelta = timedelta(days=30)
+# Window before expiry within which a permit can be renewed
+RENEWAL_WINDOW: timedelta = timedelta(days=30)
+# Annual fee of each permit type
+PERMIT_FEES: MappingProxyType[str, float] = MappingProxyType(
+    {
+        "residential": 120.0,
+        "visitor": 50.0,
+        "business": 300.0,
+    }
+)
+# Permit statuses in which the fee can be paid, and in which the permit can be renewed
+PAYABLE_STATUSES: frozenset[str] = frozenset({"pending", "expired"})
+RENEWABLE_STATUSES: frozenset[str] = frozenset({"active", "expired"})
+
 
 class CheckParkingPermitsInput(BaseModel):
     """Input schema for the check_parking_permits tool."""
@@ -39,15 +60,15 @@ class CheckParkingPermitsTool(BaseTool):
         if not citizen_permits:
             return f"No parking permits found for citizen {state.current_citizen_id}."
 
-        result: str = f"Parking permits for citizen {state.current_citizen_id}:\n"
-        for permit in citizen_permits:
-            result += (
-                f"- Permit {permit['permit_id']}: {permit['permit_type']} permit for vehicle {permit['vehicle_plate']} "
-                f"in {permit['zone']}, valid from {permit['start_date'].strftime('%Y-%m-%d')} to "
-                f"{permit['end_date'].strftime('%Y-%m-%d')}, status: {permit['status']}\n"
-            )
+        lines: list[str] = [f"Parking permits for citizen {state.current_citizen_id}:"]
+        lines.extend(
+            f"- Permit {permit['permit_id']}: {permit['permit_type']} permit for vehicle {permit['vehicle_plate']} "
+            f"in {permit['zone']}, valid from {permit['start_date'].date().isoformat()} to "
+            f"{permit['end_date'].date().isoformat()}, status: {permit['status']}"
+            for permit in citizen_permits
+        )
 
-        return result
+        return "\n".join(lines) + "\n"
 
 
 class ApplyParkingPermitInput(BaseModel):
@@ -79,6 +100,7 @@ class ApplyParkingPermitTool(BaseTool):
         state: Annotated[PublicServiceState, InjectedState],
         tool_call_id: Annotated[str, InjectedToolCallId],
     ) -> Command:
+        now: datetime = datetime.now()
         citizen: Citizen | None = state.citizens.get(state.current_citizen_id)
 
         if not citizen:
@@ -100,23 +122,16 @@ class ApplyParkingPermitTool(BaseTool):
             raise ValueError(f"Active permit already exists for vehicle {vehicle_plate}.")
 
         # Check if citizen has been registered for at least 30 days
-        if citizen["registration_date"] > datetime.now() - timedelta(days=30):
+        if citizen["registration_date"] > now - MIN_REGISTRATION_PERIOD:
             raise ValueError("Citizen must be registered for at least 30 days to apply for a parking permit.")
 
         # Simulate application processing delay
-        if random() < 0.1:
+        if _rng.random() < 0.1:
             raise ValueError("Application processing failed due to system error. Please try again later.")
 
-        # Determine permit fee based on type
-        permit_fees: dict[str, float] = {
-            "residential": 120.0,
-            "visitor": 50.0,
-            "business": 300.0,
-        }
-
         # Generate new permit ID
-        permit_count: int = len(state.parking_permits)
-        new_permit_id: str = f"PP{permit_count + 1:03d}"
+        new_permit_id: str = f"PP{state.permit_id_counter:03d}"
+        state.permit_id_counter += 1
 
         # Create new permit
         new_permit: ParkingPermit = {
@@ -124,19 +139,18 @@ class ApplyParkingPermitTool(BaseTool):
             "citizen_id_number": state.current_citizen_id,
             "permit_type": permit_type,
             "vehicle_plate": vehicle_plate,
-            "start_date": datetime.now(),
-            "end_date": datetime.now() + timedelta(days=365),
+            "start_date": now,
+            "end_date": now + PERMIT_VALIDITY,
             "status": "pending",
             "fee_paid": False,
             "zone": zone,
-            "annual_fee": permit_fees[permit_type],
+            "annual_fee": PERMIT_FEES[permit_type],
         }
 
-        state.parking_permits[new_permit_id] = new_permit
-
         return Command(
             update={
-                "parking_permits": state.parking_permits,
+                "parking_permits": {new_permit_id: new_permit},
+                "permit_id_counter": state.permit_id_counter,
                 "messages": [
                     ToolMessage(
                         content=(
@@ -188,27 +202,26 @@ class PayParkingPermitFeeTool(BaseTool):
         if permit["fee_paid"]:
             raise ValueError(f"Fee for permit {permit_id} has already been paid.")
 
-        if permit["status"] not in ["pending", "expired"]:
+        if permit["status"] not in PAYABLE_STATUSES:
             raise ValueError(f"Cannot pay fee for permit {permit_id} with status {permit['status']}.")
 
         # Simulate payment processing
-        if random() < 0.05:
+        if _rng.random() < 0.05:
             raise ValueError("Payment processing failed. Please try again later.")
 
-        # Update permit status
-        permit["fee_paid"] = True
-        permit["status"] = "active"
-
         # If permit was expired, extend validity for another year
         if permit["status"] == "expired":
-            permit["start_date"] = datetime.now()
-            permit["end_date"] = datetime.now() + timedelta(days=365)
+            now: datetime = datetime.now()
+            permit["start_date"] = now
+            permit["end_date"] = now + PERMIT_VALIDITY
 
-        state.parking_permits[permit_id] = permit
+        # Update permit status
+        permit["fee_paid"] = True
+        permit["status"] = "active"
 
         return Command(
             update={
-                "parking_permits": state.parking_permits,
+                "parking_permits": {permit_id: permit},
                 "messages": [
                     ToolMessage(
                         content=(
@@ -256,29 +269,27 @@ class RenewParkingPermitTool(BaseTool):
         if permit["citizen_id_number"] != state.current_citizen_id:
             raise ValueError(f"Permit {permit_id} does not belong to current citizen.")
 
-        if permit["status"] not in ["active", "expired"]:
+        if permit["status"] not in RENEWABLE_STATUSES:
             raise ValueError(f"Cannot renew permit {permit_id} with status {permit['status']}.")
 
         # Check if permit is close to expiry (within 30 days) or already expired
         days_until_expiry: int = (permit["end_date"] - datetime.now()).days
-        if days_until_expiry > 30 and permit["status"] == "active":
+        if days_until_expiry > RENEWAL_WINDOW.days and permit["status"] == "active":
             raise ValueError(f"Permit {permit_id} can only be renewed within 30 days of expiry.")
 
         # Simulate renewal processing
-        if random() < 0.05:
+        if _rng.random() < 0.05:
             raise ValueError("Renewal processing failed due to system error. Please try again later.")
 
         # Update permit dates and set to pending payment
         permit["start_date"] = permit["end_date"]  # Start from current end date
-        permit["end_date"] = permit["start_date"] + timedelta(days=365)
+        permit["end_date"] = permit["start_date"] + PERMIT_VALIDITY
         permit["status"] = "pending"
         permit["fee_paid"] = False
 
-        state.parking_permits[permit_id] = permit
-
         return Command(
             update={
-                "parking_permits": state.parking_permits,
+                "parking_permits": {permit_id: permit},
                 "messages": [
                     ToolMessage(
                         content=(
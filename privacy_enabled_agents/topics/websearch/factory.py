@@ -1,3 +1,6 @@
+from functools import lru_cache
+from typing import Literal
+
 from langchain_core.language_models import BaseChatModel
 from langchain_core.runnables import RunnableConfig
 from langchain_core.tools import BaseTool
@@ -39,6 +42,29 @@ Arguments: None
 </Tools>
 """
 
+# Default prompt with the PII prelude, built once instead of on every agent creation
+WEBSEARCH_AGENT_PII_PROMPT = PII_PRELUDE_PROMPT + "\n" + WEBSEARCH_AGENT_PROMPT
+
+
+@lru_cache
+def get_websearch_tools(search_provider: Literal["ddgs", "tavily"]) -> tuple[BaseTool, ...]:
+    """
+    Get the tools of the websearch agent, created once per search provider as they are stateless.
+
+    Args:
+        search_provider (Literal["ddgs", "tavily"]): The search provider to use for the web search tool.
+
+    Returns:
+        tuple[BaseTool, ...]: The date tool and the web search tool of the provider.
+    """
+    match search_provider:
+        case "ddgs":
+            return GetCurrentDateTool(), SearchWebTool()
+        case "tavily":
+            from langchain_tavily import TavilySearch
+
+            return GetCurrentDateTool(), TavilySearch(max_results=5, topic="general")
+
 
 class WebSearchAgentFactory(AgentFactory):
     @classmethod
@@ -52,20 +78,11 @@ class WebSearchAgentFactory(AgentFactory):
     ) -> CompiledStateGraph:
         pea_settings = PEASettings()
 
-        tools: list[BaseTool] = [GetCurrentDateTool()]
-
-        match pea_settings.search_provider:
-            case "ddgs":
-                tools.append(SearchWebTool())
-            case "tavily":
-                from langchain_tavily import TavilySearch
-
-                tools.append(TavilySearch(max_results=5, topic="general"))
+        tools: tuple[BaseTool, ...] = get_websearch_tools(pea_settings.search_provider)
 
         if prompt is None:
-            prompt = WEBSEARCH_AGENT_PROMPT
-
-        if pii_guarding_enabled:
+            prompt = WEBSEARCH_AGENT_PII_PROMPT if pii_guarding_enabled else WEBSEARCH_AGENT_PROMPT
+        elif pii_guarding_enabled:
             prompt = PII_PRELUDE_PROMPT + "\n" + prompt
 
         chat_model_with_tools = chat_model.bind_tools(
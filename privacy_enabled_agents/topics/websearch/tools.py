@@ -1,18 +1,32 @@
 from datetime import date
 from functools import lru_cache
-from typing import Literal
+from time import monotonic
+from typing import TYPE_CHECKING, Literal
 
-from ddgs import DDGS
 from langchain_core.tools import ArgsSchema, BaseTool
 from pydantic import BaseModel, Field
 
+if TYPE_CHECKING:
+    from ddgs import DDGS
+
+# Seconds for which the results of a search query are reused
+SEARCH_CACHE_TTL: int = 300
+
 
 @lru_cache
-def get_ddgs_client() -> DDGS:
+def get_ddgs_client() -> "DDGS":
     """Create and return a DDGS client for web search."""
+    from ddgs import DDGS
+
     return DDGS()
 
 
+@lru_cache(maxsize=512)
+def _search(query: str, ttl_bucket: int) -> tuple[dict[str, str], ...]:
+    """Run a web search, cached per query within the same TTL bucket of the monotonic clock."""
+    return tuple(get_ddgs_client().text(query=query, region="de-de", backend="google", max_results=5))
+
+
 class SearchWebInput(BaseModel):
     """Input schema for the search_web tool."""
 
@@ -33,13 +47,7 @@ class SearchWebTool(BaseTool):
     response_format: Literal["content", "content_and_artifact"] = "content"
 
     def _run(self, query: str) -> list[dict[str, str]]:
-        ddgs: DDGS = get_ddgs_client()
-        results: list[dict[str, str]] = ddgs.text(
-            query=query,
-            region="de-de",
-            backend="google",
-            max_results=5,
-        )
+        results: list[dict[str, str]] = list(_search(query, int(monotonic() // SEARCH_CACHE_TTL)))
         return results
 
 